@@ -40,6 +40,8 @@ def no_f_string(value_for_log):
             logger.debug("Значение: %s", value_for_log())
 
 
+# Полноценный бенчмарк с прогревом, повторами, статистикой и выгрузкой в JSON:
+# python -m logging_utils.logging_benchmark
 if __name__ == "__main__":
     f_string(heavy_func)
     no_f_string(heavy_func)
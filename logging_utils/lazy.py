@@ -0,0 +1,117 @@
+"""
+Ленивые аргументы для логирования — продолжение мысли из
+"Why you should avoid the f-string when logging.py".
+
+Даже %-стиль logger.debug("%s", heavy_func()) вызывает heavy_func()
+до проверки уровня. lazy(heavy_func) откладывает вызов до момента,
+когда запись реально форматируется обработчиком:
+
+    logger.debug("Значение: %s", lazy(heavy_func))
+
+LazyLogger — адаптер, у которого выключенный уровень стоит одну
+проверку по словарю и ничего больше.
+"""
+
+import logging
+
+_UNSET = object()
+
+
+class Lazy:
+    """
+    Обёртка над callable: значение вычисляется при первом форматировании
+    и запоминается (несколько обработчиков не вызовут функцию повторно).
+    """
+
+    __slots__ = ("_func", "_args", "_kwargs", "_value")
+
+    def __init__(self, func, *args, **kwargs):
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+        self._value = _UNSET
+
+    @property
+    def value(self):
+        if self._value is _UNSET:
+            self._value = self._func(*self._args, **self._kwargs)
+        return self._value
+
+    def __str__(self):
+        return str(self.value)
+
+    def __repr__(self):
+        return repr(self.value)
+
+    def __format__(self, format_spec):
+        return format(self.value, format_spec)
+
+    # Для шаблонов вида "%d" и "%.2f"
+    def __int__(self):
+        return int(self.value)
+
+    def __index__(self):
+        return self.value.__index__()
+
+    def __float__(self):
+        return float(self.value)
+
+
+def lazy(func, *args, **kwargs) -> Lazy:
+    """lazy(heavy_func) или lazy(compute, x, key=y) — аргумент, который считается только при выводе"""
+    return Lazy(func, *args, **kwargs)
+
+
+class LazyLogger(logging.LoggerAdapter):
+    """
+    Адаптер логгера с быстрой проверкой уровня.
+
+    Результат isEnabledFor берётся из того же словаря, что использует сам
+    logging (Logger._cache — приватный атрибут CPython; если его нет,
+    проверка просто идёт через logger.isEnabledFor). logging очищает кэш при
+    изменении уровней (setLevel, logging.disable, dictConfig), но флаг
+    logger.disabled в него не входит, поэтому он проверяется первым — как
+    и в Logger.isEnabledFor.
+    """
+
+    def __init__(self, logger: logging.Logger, extra=None):
+        super().__init__(logger, extra)
+        # Старые/нестандартные логгеры могут не иметь _cache — тогда без кэша
+        self._cache = getattr(logger, "_cache", None)
+
+    def isEnabledFor(self, level):
+        if self.logger.disabled:
+            return False
+        cache = self._cache
+        if cache is not None:
+            try:
+                return cache[level]
+            except KeyError:
+                pass
+        return self.logger.isEnabledFor(level)
+
+    def process(self, msg, kwargs):
+        # В отличие от LoggerAdapter по умолчанию не затираем extra,
+        # если адаптер создан без него
+        if self.extra:
+            kwargs["extra"] = {**self.extra, **kwargs.get("extra", {})}
+        return msg, kwargs
+
+    def _emit(self, level, msg, args, kwargs):
+        msg, kwargs = self.process(msg, kwargs)
+        # Пропускаем кадры _emit и публичного метода адаптера,
+        # чтобы funcName/lineno указывали на вызывающий код
+        kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 2
+        self.logger.log(level, msg, *args, **kwargs)
+
+    def log(self, level, msg, *args, **kwargs):
+        if self.isEnabledFor(level):
+            self._emit(level, msg, args, kwargs)
+
+    def debug(self, msg, *args, **kwargs):
+        if self.isEnabledFor(logging.DEBUG):
+            self._emit(logging.DEBUG, msg, args, kwargs)
+
+    def info(self, msg, *args, **kwargs):
+        if self.isEnabledFor(logging.INFO):
+            self._emit(logging.INFO, msg, args, kwargs)
@@ -0,0 +1,229 @@
+"""
+Бенчмарк стратегий логирования — развитие примера
+"Why you should avoid the f-string when logging.py".
+
+Каждый сценарий прогоняется warmup раз вхолостую, затем repeat раз по number
+вызовов; по прогонам считаются min/median/mean/stdev в наносекундах на вызов.
+Результат можно выгрузить в JSON, чтобы сравнивать версии Python между собой.
+
+Запуск:
+    python -m logging_utils.logging_benchmark --json bench.json
+"""
+
+import argparse
+from dataclasses import dataclass
+import json
+import logging
+import logging.handlers
+import platform
+import queue
+import statistics
+import sys
+import time
+from typing import Callable
+
+from logging_utils.lazy import LazyLogger, lazy
+
+
+def heavy_func():
+    # Без sleep, как в демо: сон даёт шум больше, чем сама разница стратегий
+    return sum(range(200))
+
+
+class _RejectAll(logging.Filter):
+    def filter(self, record):
+        return False
+
+
+@dataclass
+class Case:
+    name: str
+    description: str
+    # setup возвращает (функцию для замера, функцию очистки)
+    setup: Callable[[], tuple[Callable[[], None], Callable[[], None]]]
+
+
+def _make_logger(name: str, level: int, handler: logging.Handler = None) -> logging.Logger:
+    logger = logging.getLogger(f"logging_benchmark.{name}")
+    logger.handlers.clear()
+    logger.filters.clear()
+    logger.propagate = False
+    logger.disabled = False
+    logger.setLevel(level)
+    logger.addHandler(handler or logging.NullHandler())
+    return logger
+
+
+def _noop():
+    pass
+
+
+def _fstring_disabled():
+    logger = _make_logger("fstring_disabled", logging.INFO)
+    return lambda: logger.debug(f"Значение: {heavy_func()}"), _noop
+
+
+def _percent_disabled():
+    logger = _make_logger("percent_disabled", logging.INFO)
+    # Аргумент всё равно вычисляется до вызова debug — экономится только форматирование
+    return lambda: logger.debug("Значение: %s", heavy_func()), _noop
+
+
+def _guarded_disabled():
+    logger = _make_logger("guarded_disabled", logging.INFO)
+
+    def run():
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Значение: %s", heavy_func())
+
+    return run, _noop
+
+
+def _lazy_disabled():
+    logger = _make_logger("lazy_disabled", logging.INFO)
+    return lambda: logger.debug("Значение: %s", lazy(heavy_func)), _noop
+
+
+def _lazy_logger_disabled():
+    logger = LazyLogger(_make_logger("lazy_logger_disabled", logging.INFO))
+    return lambda: logger.debug("Значение: %s", lazy(heavy_func)), _noop
+
+
+def _disabled_logger():
+    logger = _make_logger("disabled_logger", logging.DEBUG)
+    logger.disabled = True
+    return lambda: logger.info("Значение: %s", 1), _noop
+
+
+def _fstring_enabled():
+    logger = _make_logger("fstring_enabled", logging.DEBUG)
+    return lambda: logger.info(f"Значение: {heavy_func()}"), _noop
+
+
+def _percent_enabled():
+    logger = _make_logger("percent_enabled", logging.DEBUG)
+    return lambda: logger.info("Значение: %s", heavy_func()), _noop
+
+
+def _lazy_enabled():
+    logger = _make_logger("lazy_enabled", logging.DEBUG)
+    return lambda: logger.info("Значение: %s", lazy(heavy_func)), _noop
+
+
+def _filter_rejects():
+    logger = _make_logger("filter_rejects", logging.DEBUG)
+    logger.addFilter(_RejectAll())
+    return lambda: logger.info("Значение: %s", 1), _noop
+
+
+class _NullStream:
+    """Поток, который ничего не пишет: меряем форматирование, а не терминал"""
+
+    def write(self, data):
+        return len(data)
+
+    def flush(self):
+        pass
+
+
+def _stream_handler():
+    handler = logging.StreamHandler(_NullStream())
+    handler.setFormatter(logging.Formatter("[%(levelname)s], %(message)s"))
+    logger = _make_logger("stream_handler", logging.DEBUG, handler)
+    return lambda: logger.info("Значение: %s", 1), _noop
+
+
+def _queue_handler():
+    # Стоимость для вызывающего потока: только положить запись в очередь
+    log_queue = queue.SimpleQueue()
+    handler = logging.handlers.QueueHandler(log_queue)
+    handler.setFormatter(logging.Formatter("[%(levelname)s], %(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, logging.NullHandler())
+    listener.start()
+    logger = _make_logger("queue_handler", logging.DEBUG, handler)
+    return lambda: logger.info("Значение: %s", 1), listener.stop
+
+
+CASES = [
+    Case("fstring_disabled", "f-строка, уровень DEBUG выключен", _fstring_disabled),
+    Case("percent_disabled", "%-стиль, уровень DEBUG выключен", _percent_disabled),
+    Case("guarded_disabled", "%-стиль под isEnabledFor, DEBUG выключен", _guarded_disabled),
+    Case("lazy_disabled", "ленивая обёртка, DEBUG выключен", _lazy_disabled),
+    Case("lazy_logger_disabled", "LazyLogger + lazy, DEBUG выключен", _lazy_logger_disabled),
+    Case("disabled_logger", "logger.disabled = True", _disabled_logger),
+    Case("fstring_enabled", "f-строка, запись в NullHandler", _fstring_enabled),
+    Case("percent_enabled", "%-стиль, запись в NullHandler", _percent_enabled),
+    Case("lazy_enabled", "ленивая обёртка, запись в NullHandler", _lazy_enabled),
+    Case("filter_rejects", "logging.Filter отбрасывает запись", _filter_rejects),
+    Case("stream_handler", "StreamHandler с форматированием", _stream_handler),
+    Case("queue_handler", "QueueHandler, запись уходит в фоновый поток", _queue_handler),
+]
+
+
+def measure(func: Callable[[], None], number: int, repeat: int, warmup: int) -> dict:
+    """Прогоняет func и возвращает статистику в наносекундах на вызов"""
+    for _ in range(warmup):
+        func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter_ns() - start) / number)
+    return {
+        "min_ns": min(timings),
+        "median_ns": statistics.median(timings),
+        "mean_ns": statistics.mean(timings),
+        "stdev_ns": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "max_ns": max(timings),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def run_suite(number: int = 10_000, repeat: int = 7, warmup: int = 1_000, only: list[str] = None) -> dict:
+    results = {}
+    for case in CASES:
+        if only and case.name not in only:
+            continue
+        func, teardown = case.setup()
+        try:
+            results[case.name] = measure(func, number, repeat, warmup)
+            results[case.name]["description"] = case.description
+        finally:
+            teardown()
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cases": results,
+    }
+
+
+def format_table(report: dict) -> str:
+    lines = [f"Python {report['python']} ({report['implementation']})"]
+    lines.append(f"{'case':<20}{'median ns':>12}{'min ns':>12}{'stdev ns':>12}")
+    for name, stats in report["cases"].items():
+        lines.append(f"{name:<20}{stats['median_ns']:>12.1f}{stats['min_ns']:>12.1f}{stats['stdev_ns']:>12.1f}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарк стратегий логирования")
+    parser.add_argument("--number", type=int, default=10_000, help="вызовов в одном прогоне")
+    parser.add_argument("--repeat", type=int, default=7, help="количество прогонов")
+    parser.add_argument("--warmup", type=int, default=1_000, help="холостых вызовов перед замером")
+    parser.add_argument("--only", nargs="*", help="запустить только указанные сценарии")
+    parser.add_argument("--json", help="куда сохранить результат в JSON")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.number, args.repeat, args.warmup, args.only)
+    print(format_table(report))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""
+Неблокирующая отправка логов через QueueHandler/QueueListener.
+
+logging.basicConfig вешает StreamHandler прямо на вызывающий поток:
+медленный stderr или файл тормозит каждый logger.info(...).
+setup_queue_logging ставит на корневой логгер только QueueHandler,
+а форматирование и запись уходят в фоновый поток QueueListener.
+Очередь ограничена, при переполнении работает выбранная политика:
+
+- "drop_newest" — выбросить новую запись (вызывающий код никогда не ждёт);
+- "drop_oldest" — выбросить самую старую запись из очереди;
+- "block" — подождать место в очереди не дольше block_timeout секунд,
+  после чего выбросить запись.
+
+Сообщение (msg % args) по умолчанию собирается в вызывающем потоке, как в
+стандартном QueueHandler: иначе изменяемые аргументы попали бы в лог с тем
+значением, которое у них будет к моменту записи.
+"""
+
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+
+POLICIES = ("drop_newest", "drop_oldest", "block")
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler с ограниченной очередью, политикой переполнения и счётчиком потерь"""
+
+    def __init__(self, log_queue: queue.Queue, policy: str = "drop_newest", block_timeout: float = 0.1,
+                 format_in_listener: bool = False):
+        if policy not in POLICIES:
+            raise ValueError(f"Неизвестная политика {policy!r}, ожидается одна из {POLICIES}")
+        super().__init__(log_queue)
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.format_in_listener = format_in_listener
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    def prepare(self, record):
+        # Стандартный prepare форматирует сообщение в вызывающем потоке.
+        # format_in_listener=True передаёт запись как есть, и msg % args считает
+        # поток слушателя — быстрее для вызывающего кода, но небезопасно:
+        # если аргументы изменятся до записи, в лог попадёт новое значение.
+        if self.format_in_listener:
+            return record
+        return super().prepare(record)
+
+    def enqueue(self, record):
+        if self.policy == "block":
+            try:
+                self.queue.put(record, timeout=self.block_timeout)
+            except queue.Full:
+                self._drop()
+            return
+
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            if self.policy == "drop_newest":
+                self._drop()
+                return
+
+        # drop_oldest: освобождаем место, выкидывая голову очереди
+        try:
+            oldest = self.queue.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            if oldest is BoundedQueueListener._sentinel:
+                # Слушатель останавливается: sentinel возвращаем, выбрасываем новую запись
+                self.queue.put(oldest)
+                self._drop()
+                return
+            self._drop()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self._drop()
+
+    def _drop(self):
+        with self._dropped_lock:
+            self.dropped += 1
+
+
+class BoundedQueueListener(logging.handlers.QueueListener):
+    """QueueListener, который при остановке дожидается места под sentinel в полной очереди"""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+class QueueLogging:
+    """Результат setup_queue_logging: держит listener и умеет его остановить"""
+
+    def __init__(self, handler: BoundedQueueHandler, listener: BoundedQueueListener,
+                 logger: logging.Logger, previous_handlers: list, previous_level: int = logging.NOTSET):
+        self.handler = handler
+        self.listener = listener
+        self.logger = logger
+        self._previous_handlers = previous_handlers
+        self._previous_level = previous_level
+
+    @property
+    def dropped(self) -> int:
+        return self.handler.dropped
+
+    def stop(self):
+        """Дописывает всё, что осталось в очереди, и возвращает прежние обработчики и уровень"""
+        if self.listener is None:
+            return
+        # Сначала снимаем обработчик: новые записи не должны вытеснять sentinel слушателя
+        self.logger.removeHandler(self.handler)
+        self.listener.stop()
+        self.listener = None
+        for handler in self._previous_handlers:
+            self.logger.addHandler(handler)
+        self.logger.setLevel(self._previous_level)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+
+def setup_queue_logging(
+    handlers: list[logging.Handler] = None,
+    level: int = logging.INFO,
+    fmt: str = "[%(levelname)s], %(message)s",
+    maxsize: int = 10_000,
+    policy: str = "drop_newest",
+    block_timeout: float = 0.1,
+    logger: logging.Logger = None,
+    format_in_listener: bool = False,
+) -> QueueLogging:
+    """
+    Аналог logging.basicConfig(level=..., format=...), но с фоновой записью.
+    По умолчанию настраивает корневой логгер и пишет в stderr.
+    Прежние обработчики и уровень логгера возвращаются при stop().
+    format_in_listener=True — см. BoundedQueueHandler.prepare.
+    """
+    logger = logger or logging.getLogger()
+    if handlers is None:
+        handlers = [logging.StreamHandler(sys.stderr)]
+    formatter = logging.Formatter(fmt)
+    for handler in handlers:
+        if handler.formatter is None:
+            handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(maxsize)
+    queue_handler = BoundedQueueHandler(log_queue, policy=policy, block_timeout=block_timeout,
+                                        format_in_listener=format_in_listener)
+    listener = BoundedQueueListener(log_queue, *handlers, respect_handler_level=True)
+
+    previous_handlers = list(logger.handlers)
+    previous_level = logger.level
+    for handler in previous_handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(queue_handler)
+    logger.setLevel(level)
+
+    listener.start()
+    return QueueLogging(queue_handler, listener, logger, previous_handlers, previous_level)
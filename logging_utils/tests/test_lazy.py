@@ -0,0 +1,58 @@
+import logging
+
+from logging_utils.lazy import LazyLogger, lazy
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return 42
+
+
+def test_lazy_is_not_evaluated_when_level_is_off(caplog):
+    heavy = Counter()
+    logger = LazyLogger(logging.getLogger("test_lazy.off"))
+    with caplog.at_level(logging.INFO, logger="test_lazy.off"):
+        logger.debug("Значение: %s", lazy(heavy))
+    assert heavy.calls == 0
+    assert not caplog.records
+
+
+def test_lazy_is_evaluated_once_when_formatted(caplog):
+    heavy = Counter()
+    logger = LazyLogger(logging.getLogger("test_lazy.on"))
+    with caplog.at_level(logging.DEBUG, logger="test_lazy.on"):
+        logger.debug("Значение: %s, %d, %.1f", *[lazy(heavy)] * 3)
+    assert caplog.records[0].getMessage() == "Значение: 42, 42, 42.0"
+    assert heavy.calls == 1
+    assert caplog.records[0].funcName == "test_lazy_is_evaluated_once_when_formatted"
+
+
+def test_cached_level_follows_configuration_changes():
+    inner = logging.getLogger("test_lazy.config")
+    logger = LazyLogger(inner)
+    inner.setLevel(logging.WARNING)
+    assert not logger.isEnabledFor(logging.INFO)
+    inner.setLevel(logging.DEBUG)
+    assert logger.isEnabledFor(logging.INFO)
+    logging.disable(logging.CRITICAL)
+    try:
+        assert not logger.isEnabledFor(logging.INFO)
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def test_disabled_logger_is_not_enabled():
+    inner = logging.getLogger("test_lazy.disabled")
+    inner.setLevel(logging.DEBUG)
+    logger = LazyLogger(inner)
+    assert logger.isEnabledFor(logging.DEBUG)
+    inner.disabled = True
+    try:
+        assert not logger.isEnabledFor(logging.DEBUG)
+        assert logger.isEnabledFor(logging.DEBUG) == inner.isEnabledFor(logging.DEBUG)
+    finally:
+        inner.disabled = False
@@ -0,0 +1,19 @@
+import json
+
+from logging_utils.logging_benchmark import CASES, main, run_suite
+
+
+def test_suite_covers_all_cases():
+    report = run_suite(number=10, repeat=2, warmup=1)
+    assert set(report["cases"]) == {case.name for case in CASES}
+    for stats in report["cases"].values():
+        assert stats["min_ns"] <= stats["median_ns"] <= stats["max_ns"]
+
+
+def test_cli_writes_json(tmp_path, capsys):
+    path = tmp_path / "bench.json"
+    assert main(["--number", "10", "--repeat", "2", "--warmup", "0",
+                 "--only", "guarded_disabled", "--json", str(path)]) == 0
+    report = json.loads(path.read_text(encoding="utf-8"))
+    assert list(report["cases"]) == ["guarded_disabled"]
+    assert "guarded_disabled" in capsys.readouterr().out
@@ -0,0 +1,120 @@
+import logging
+import queue
+import threading
+import time
+
+import pytest
+
+from logging_utils.queue_logging import BoundedQueueHandler, BoundedQueueListener, setup_queue_logging
+
+
+class SlowHandler(logging.Handler):
+    """Обработчик, который ждёт сигнала перед каждой записью"""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = threading.Event()
+        self.messages = []
+
+    def emit(self, record):
+        self.gate.wait()
+        self.messages.append(self.format(record))
+
+
+@pytest.mark.parametrize("policy", ["drop_newest", "drop_oldest", "block"])
+def test_caller_does_not_block_on_slow_handler(policy):
+    slow = SlowHandler()
+    logger = logging.getLogger(f"test_queue_logging.{policy}")
+    logger.propagate = False
+
+    queue_logging = setup_queue_logging(
+        handlers=[slow], maxsize=5, policy=policy, block_timeout=0.001, logger=logger,
+    )
+    start = time.monotonic()
+    for i in range(50):
+        logger.info("record %d", i)
+    assert time.monotonic() - start < 1
+
+    slow.gate.set()
+    queue_logging.stop()
+
+    assert queue_logging.dropped > 0
+    assert len(slow.messages) + queue_logging.dropped == 50
+    if policy == "drop_oldest":
+        assert slow.messages[-1] == "[INFO], record 49"
+    else:
+        assert slow.messages[0] == "[INFO], record 0"
+
+
+def test_stop_restores_previous_handlers():
+    logger = logging.getLogger("test_queue_logging.restore")
+    previous = logging.NullHandler()
+    logger.addHandler(previous)
+
+    with setup_queue_logging(handlers=[logging.NullHandler()], logger=logger):
+        assert previous not in logger.handlers
+    assert logger.handlers == [previous]
+    assert logger.level == logging.NOTSET
+
+
+def test_stop_restores_previous_level():
+    logger = logging.getLogger("test_queue_logging.level")
+    logger.setLevel(logging.WARNING)
+
+    with setup_queue_logging(handlers=[logging.NullHandler()], level=logging.DEBUG, logger=logger):
+        assert logger.level == logging.DEBUG
+    assert logger.level == logging.WARNING
+
+
+@pytest.mark.parametrize("format_in_listener, expected", [(False, "{'step': 1}"), (True, "{'step': 2}")])
+def test_message_formatted_in_caller_by_default(format_in_listener, expected):
+    slow = SlowHandler()
+    logger = logging.getLogger(f"test_queue_logging.args.{format_in_listener}")
+    logger.propagate = False
+
+    queue_logging = setup_queue_logging(handlers=[slow], logger=logger, format_in_listener=format_in_listener)
+    state = {"step": 1}
+    logger.info("state=%s", state)
+    state["step"] = 2
+    slow.gate.set()
+    queue_logging.stop()
+
+    assert slow.messages == [f"[INFO], state={expected}"]
+
+
+def test_drop_oldest_keeps_listener_sentinel():
+    log_queue = queue.Queue(2)
+    handler = BoundedQueueHandler(log_queue, policy="drop_oldest")
+    record = logging.makeLogRecord({"msg": "old"})
+    log_queue.put(record)
+    log_queue.put(BoundedQueueListener._sentinel)
+
+    handler.handle(logging.makeLogRecord({"msg": "new"}))  # вытесняет "old"
+    handler.handle(logging.makeLogRecord({"msg": "newest"}))  # голова — sentinel, он остаётся
+
+    items = [log_queue.get_nowait() for _ in range(log_queue.qsize())]
+    assert BoundedQueueListener._sentinel in items
+    assert handler.dropped == 2
+
+
+def test_stop_while_other_threads_log_under_drop_oldest():
+    logger = logging.getLogger("test_queue_logging.stop_busy")
+    logger.propagate = False
+    queue_logging = setup_queue_logging(handlers=[logging.NullHandler()], maxsize=2,
+                                        policy="drop_oldest", logger=logger)
+    done = threading.Event()
+
+    def spam():
+        while not done.is_set():
+            logger.info("busy")
+
+    threads = [threading.Thread(target=spam) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    stopper = threading.Thread(target=queue_logging.stop, daemon=True)
+    stopper.start()
+    stopper.join(timeout=5)
+    done.set()
+    for thread in threads:
+        thread.join()
+    assert not stopper.is_alive()
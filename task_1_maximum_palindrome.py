@@ -3,22 +3,184 @@
 # Строка содержит n целых чисел a₁, a₂, ..., aₙ (1 ≤ aᵢ ≤ 1 0 9 10^9109) — последовательность.
 # Формат вывода
 # Выведите одно целое число — длину самого длинного палиндрома в записи. Если такого нет, выведите 0.
+#
+# Палиндром ищется в последовательности чисел, а не в строке без пробелов:
+# "10 1" — это [10, 1], а не "101". Алгоритм Манакера — O(n) времени и памяти
+# вместо перебора всех подстрок за O(n³). Бенчмарк:
+#     python task_1_maximum_palindrome.py bench --max-size 10000000
+#
+# Большие файлы — по последовательности на строку, ответ на строку:
+#     python task_1_maximum_palindrome.py scan sequences.txt --workers 4
+#     generate | python task_1_maximum_palindrome.py scan - --positions
+
+import argparse
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import os
+import random
+import sys
+import time
+from typing import BinaryIO, Iterator, Sequence
+
+# С какой длины искать палиндром в компактном варианте (меньше памяти, медленнее)
+COMPACT_THRESHOLD = 1 << 20
+CHUNK_BYTES = 1 << 20
 
 
 def pal(string):
     return string == string[::-1] and len(string) > 1
 
 
-def max_len(string):
-    string = string.replace(" ", "")
-    print(string)
-    lst = []
-    for i in range(len(string)):
-        for j in range(i, len(string)):
-            sub = string[i : j + 1]
+def max_len_bruteforce(seq: Sequence) -> int:
+    """Исходный перебор всех отрезков — для проверки и сравнения на малых n"""
+    best = 0
+    for i in range(len(seq)):
+        for j in range(i, len(seq)):
+            sub = seq[i : j + 1]
             if pal(sub):
-                lst.append(len(sub))
-    return max(lst) if lst else 0
+                best = max(best, len(sub))
+    return best
+
+
+def longest_palindrome(seq: Sequence) -> tuple[int, int]:
+    """
+    (начало, длина) самого длинного непрерывного палиндрома; при равной
+    длине — самого левого. Для пустой последовательности (0, 0).
+
+    Манакер по последовательности с разделителями между элементами:
+    [L, |, a0, |, a1, ..., |, R] — так палиндромы чётной и нечётной длины
+    обрабатываются одним проходом, а разные L и R на концах останавливают
+    расширение без проверки границ. Разделители — отдельные object(),
+    они не равны никакому элементу, так что подходят любые сравнимые значения.
+    """
+    n = len(seq)
+    if n == 0:
+        return 0, 0
+    sep = object()
+    t = [sep] * (2 * n + 3)
+    t[0], t[-1] = object(), object()
+    t[2 : 2 * n + 1 : 2] = seq
+    radius = [0] * len(t)
+    center = right = 0
+    best = best_center = 0
+    for i in range(1, len(t) - 1):
+        if i < right:
+            r = radius[2 * center - i]
+            if r > right - i:
+                r = right - i
+        else:
+            r = 0
+        while t[i - r - 1] == t[i + r + 1]:
+            r += 1
+        radius[i] = r
+        if i + r > right:
+            center, right = i, i + r
+        if r > best:
+            best, best_center = r, i
+    # Радиус в расширенной последовательности равен длине палиндрома в исходной
+    return (best_center - best - 1) // 2, best
+
+
+def longest_palindrome_compact(seq: Sequence) -> tuple[int, int]:
+    """
+    То же, что longest_palindrome, но без расширенной копии: разделители
+    только подразумеваются (чётные позиции), радиусы лежат в array.
+    Около 16 байт на элемент поверх seq вместо ~64 — и примерно вдвое дольше.
+    Рассчитан на array('q') из iter_sequences.
+    """
+    n = len(seq)
+    m = 2 * n + 1
+    typecode = "i" if m < 2**31 else "q"
+    radius = array(typecode, bytes(array(typecode).itemsize * m))
+    center = right = 0
+    best = best_center = 0
+    for i in range(m):
+        if i < right:
+            r = radius[2 * center - i]
+            if r > right - i:
+                r = right - i
+        else:
+            r = 0
+        lo = i - r - 1
+        hi = i + r + 1
+        # На чётных позициях разделители — они всегда совпадают
+        while lo >= 0 and hi < m and (not lo & 1 or seq[lo >> 1] == seq[hi >> 1]):
+            lo -= 1
+            hi += 1
+        r = hi - i - 1
+        radius[i] = r
+        if hi - 1 > right:
+            center, right = i, hi - 1
+        if r > best:
+            best, best_center = r, i
+    return (best_center - best) // 2, best
+
+
+def parse_sequence(line: str) -> list[int]:
+    return list(map(int, line.split()))
+
+
+def max_len(string) -> int:
+    """Ответ задачи: длина самого длинного палиндрома из 2+ элементов, иначе 0"""
+    seq = parse_sequence(string) if isinstance(string, str) else string
+    length = longest_palindrome(seq)[1]
+    return length if length > 1 else 0
+
+
+def iter_sequences(stream: BinaryIO, chunk_bytes: int = CHUNK_BYTES) -> Iterator[array]:
+    """
+    Последовательности из двоичного потока по одной на строку, каждая — array('q').
+    Поток читается кусками по chunk_bytes: ни файл, ни строка целиком
+    в виде Python-строки не создаются. Пустые строки дают пустые массивы.
+    """
+    current = array("q")
+    pending = b""  # число, разрезанное границей куска
+    while True:
+        chunk = stream.read(chunk_bytes)
+        if not chunk:
+            break
+        lines = (pending + chunk).split(b"\n")
+        for line in lines[:-1]:
+            current.extend(map(int, line.split()))
+            yield current
+            current = array("q")
+        tokens = lines[-1].split()
+        pending = tokens.pop() if tokens and not lines[-1][-1:].isspace() else b""
+        current.extend(map(int, tokens))
+    if pending or current:
+        current.extend(map(int, pending.split()))
+        yield current
+
+
+def solve(seq: Sequence) -> tuple[int, int]:
+    """(начало, длина) палиндрома из 2+ элементов или (0, 0)"""
+    if len(seq) >= COMPACT_THRESHOLD:
+        start, length = longest_palindrome_compact(seq)
+    else:
+        start, length = longest_palindrome(seq)
+    return (start, length) if length > 1 else (0, 0)
+
+
+def solve_stream(stream: BinaryIO, workers: int = None, chunk_bytes: int = CHUNK_BYTES) -> Iterator[tuple[int, int]]:
+    """
+    Ответы solve() для каждой строки потока в исходном порядке.
+    workers=1 — в текущем процессе; иначе строки раздаются пулу процессов,
+    и в работе одновременно не больше 2 * workers последовательностей.
+    """
+    sequences = iter_sequences(stream, chunk_bytes)
+    if workers == 1:
+        yield from map(solve, sequences)
+        return
+    workers = workers or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for seq in sequences:
+            pending.append(pool.submit(solve, seq))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
 
 lst_test_string = [
@@ -27,7 +189,72 @@ lst_test_string = [
     "1 2 3 4 5 5 4 3 2 1",
     "1 2 3 1 2 3",
     "112",
+    "10 1 10",
 ]
 
-for el in lst_test_string:
-    print(max_len(el))
+
+def benchmark(sizes: list[int], seed: int = 0, baseline_limit: int = 300) -> list[dict]:
+    """
+    Время на случайных числах 1..3 (много коротких палиндромов) и на одинаковых
+    (худший случай для расширения). Перебор — только для n <= baseline_limit.
+    """
+    rng = random.Random(seed)
+    results = []
+    for size in sizes:
+        inputs = {
+            "random": [rng.randint(1, 3) for _ in range(size)],
+            "equal": [7] * size,
+        }
+        for kind, seq in inputs.items():
+            start = time.perf_counter()
+            length = max_len(seq)
+            elapsed = time.perf_counter() - start
+            row = {"size": size, "input": kind, "length": length, "manacher_sec": elapsed}
+            if size <= baseline_limit:
+                start = time.perf_counter()
+                assert max_len_bruteforce(seq) == length
+                row["bruteforce_sec"] = time.perf_counter() - start
+            results.append(row)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Самый длинный палиндром в последовательности чисел")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("demo", help="примеры из условия (по умолчанию)")
+    bench = commands.add_parser("bench", help="сравнение с перебором и рост времени до 10^7")
+    bench.add_argument("--max-size", type=int, default=1_000_000)
+    bench.add_argument("--baseline-limit", type=int, default=300, help="до какого n запускать перебор")
+    scan = commands.add_parser("scan", help="ответ для каждой строки файла")
+    scan.add_argument("path", help="файл с последовательностями по одной на строку, '-' — stdin")
+    scan.add_argument("--workers", type=int, default=os.cpu_count())
+    scan.add_argument("--chunk-bytes", type=int, default=CHUNK_BYTES)
+    scan.add_argument("--positions", action="store_true", help="выводить 'начало длина' вместо длины")
+    args = parser.parse_args(argv)
+
+    if args.command == "scan":
+        stream = sys.stdin.buffer if args.path == "-" else open(args.path, "rb")
+        try:
+            for start, length in solve_stream(stream, args.workers, args.chunk_bytes):
+                print(f"{start} {length}" if args.positions else length)
+        finally:
+            if stream is not sys.stdin.buffer:
+                stream.close()
+        return 0
+
+    if args.command == "bench":
+        sizes = [size for size in (100, 300, 10**3, 10**4, 10**5, 10**6, 10**7) if size <= args.max_size]
+        print(f"{'n':>10} {'вход':<8} {'длина':>8} {'Манакер, с':>12} {'нс/элемент':>11} {'перебор, с':>11}")
+        for row in benchmark(sizes, baseline_limit=args.baseline_limit):
+            brute = f"{row['bruteforce_sec']:>11.4f}" if "bruteforce_sec" in row else f"{'—':>11}"
+            print(f"{row['size']:>10} {row['input']:<8} {row['length']:>8} {row['manacher_sec']:>12.4f} "
+                  f"{row['manacher_sec'] / row['size'] * 1e9:>11.0f} {brute}")
+        return 0
+
+    for el in lst_test_string:
+        print(max_len(el))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
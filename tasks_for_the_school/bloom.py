@@ -0,0 +1,148 @@
+"""
+Фильтр Блума в файле для проверки паролей по базе утечек.
+
+Файл строится один раз (офлайн) и открывается через mmap только на чтение:
+открытие мгновенное, страницы подтягиваются с диска по мере обращений и
+разделяются page cache между всеми процессами, открывшими тот же файл.
+
+Формат: заголовок "<8s Q I Q>" — magic, число бит m, число хешей k,
+число добавленных элементов; дальше m бит. Позиции — двойное хеширование
+h1 + i*h2 по 128-битному blake2b от байтов пароля.
+
+Сборка из списка паролей (по одному на строку):
+    python -m tasks_for_the_school.bloom breached.txt breached.bloom --fp-rate 0.001
+"""
+
+import argparse
+import hashlib
+import math
+import mmap
+import os
+import struct
+import sys
+from typing import Iterable
+
+MAGIC = b"BLOOM001"
+HEADER = struct.Struct("<8sQIQ")
+
+
+def _encode(item) -> bytes:
+    # surrogateescape — тем же способом password_audit декодирует невалидный UTF-8
+    return item if isinstance(item, bytes) else item.encode("utf-8", "surrogateescape")
+
+
+def _hashes(item) -> tuple[int, int]:
+    digest = hashlib.blake2b(_encode(item), digest_size=16).digest()
+    # h2 нечётный — шаг не вырождается в 0
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+
+def optimal_params(expected: int, fp_rate: float) -> tuple[int, int]:
+    """(m, k) для expected элементов и целевой доли ложных срабатываний"""
+    if not 0 < fp_rate < 1:
+        raise ValueError("fp_rate должно быть в (0, 1)")
+    expected = max(1, expected)
+    bits = math.ceil(-expected * math.log(fp_rate) / math.log(2) ** 2)
+    hashes = max(1, round(bits / expected * math.log(2)))
+    return bits, hashes
+
+
+class BloomFilter:
+    """Фильтр поверх mmap файла; `item in bloom` — возможно есть (True) или точно нет (False)"""
+
+    def __init__(self, path, writable: bool = False):
+        self.path = os.fspath(path)
+        self.writable = writable
+        with open(self.path, "r+b" if writable else "rb") as file:
+            self._mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        magic, self.bits, self.hashes, self.count = HEADER.unpack_from(self._mm)
+        if magic != MAGIC or len(self._mm) < HEADER.size + (self.bits + 7) // 8:
+            self._mm.close()
+            raise ValueError(f"{self.path}: не файл фильтра Блума")
+
+    @classmethod
+    def create(cls, path, expected: int, fp_rate: float = 0.001) -> "BloomFilter":
+        """Пустой фильтр нужного размера, открытый на запись (файл разреженный)"""
+        bits, hashes = optimal_params(expected, fp_rate)
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, bits, hashes, 0))
+            file.truncate(HEADER.size + (bits + 7) // 8)
+        return cls(path, writable=True)
+
+    def add(self, item):
+        h1, h2 = _hashes(item)
+        mm, bits = self._mm, self.bits
+        for i in range(self.hashes):
+            position = (h1 + i * h2) % bits
+            mm[HEADER.size + (position >> 3)] |= 1 << (position & 7)
+        self.count += 1
+
+    def update(self, items: Iterable):
+        for item in items:
+            self.add(item)
+        HEADER.pack_into(self._mm, 0, MAGIC, self.bits, self.hashes, self.count)
+
+    def __contains__(self, item) -> bool:
+        h1, h2 = _hashes(item)
+        mm, bits = self._mm, self.bits
+        for i in range(self.hashes):
+            position = (h1 + i * h2) % bits
+            if not mm[HEADER.size + (position >> 3)] >> (position & 7) & 1:
+                return False
+        return True
+
+    def expected_fp_rate(self) -> float:
+        """Оценка доли ложных срабатываний при текущем заполнении"""
+        return (1 - math.exp(-self.hashes * self.count / self.bits)) ** self.hashes
+
+    def close(self):
+        if self._mm.closed:
+            return
+        if self.writable:
+            HEADER.pack_into(self._mm, 0, MAGIC, self.bits, self.hashes, self.count)
+            self._mm.flush()
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def iter_lines(path) -> Iterable[bytes]:
+    """Строки файла как байты без перевода строки; пустые пропускаются"""
+    with open(path, "rb") as file:
+        for line in file:
+            line = line.rstrip(b"\r\n")
+            if line:
+                yield line
+
+
+def build(source, target, fp_rate: float = 0.001, expected: int = None) -> BloomFilter:
+    """Строит фильтр из файла паролей; без expected файл читается дважды (подсчёт строк)"""
+    if expected is None:
+        expected = sum(1 for _ in iter_lines(source))
+    bloom = BloomFilter.create(target, expected, fp_rate)
+    bloom.update(iter_lines(source))
+    bloom.close()
+    return BloomFilter(target)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Сборка фильтра Блума из списка утёкших паролей")
+    parser.add_argument("source", help="файл с паролями по одному на строку")
+    parser.add_argument("target", help="куда записать фильтр")
+    parser.add_argument("--fp-rate", type=float, default=0.001, help="целевая доля ложных срабатываний")
+    parser.add_argument("--expected", type=int, help="ожидаемое число паролей (иначе считается по файлу)")
+    args = parser.parse_args(argv)
+
+    with build(args.source, args.target, args.fp_rate, args.expected) as bloom:
+        print(f"{bloom.count} паролей, {bloom.bits} бит ({bloom.bits / 8 / 2**20:.1f} МиБ), "
+              f"{bloom.hashes} хешей, ожидаемая доля ложных срабатываний {bloom.expected_fp_rate():.2e}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,9 +4,13 @@
 # 2. "!@#$%*" in password
 # 3. Заглавная бука in password
 # 4. количество digits >= 3
+# 5. пароля нет в базе утечек (NotBreachedRule, по желанию)
 
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from dataclasses import dataclass, field
+from functools import cached_property
+from time import perf_counter_ns
+from typing import Callable, TypeVar
 
 T = TypeVar("T")
 
@@ -32,6 +36,36 @@ class Rule(ABC):
         """
         pass
 
+    def error(self, value) -> CustomValidationError:
+        """
+        Ошибка для значения, не прошедшего проверку, — без raise/except.
+        Правила переопределяют её, и validate выбрасывает то же самое;
+        по умолчанию ошибка добывается через validate.
+        """
+        try:
+            self.validate(value)
+        except CustomValidationError as error:
+            return error
+        # Быстрая проверка и validate разошлись — правило реализовано неверно
+        return CustomValidationError("Значение не прошло проверку", type(self).__name__)
+
+    def compile(self) -> Callable[[T], bool]:
+        """
+        Быстрая проверка без исключений: функция value -> bool.
+        По умолчанию обёртка над validate; правила переопределяют её
+        на сишные примитивы (len, set, str.lower, bytes.translate).
+        """
+        def check(value) -> bool:
+            try:
+                self.validate(value)
+            except CustomValidationError:
+                return False
+            return True
+        return check
+
+
+_ASCII_DIGITS = b"0123456789"
+
 
 class MinLengthRule(Rule):
     def __init__(self, min_len=10):
@@ -39,7 +73,14 @@ class MinLengthRule(Rule):
 
     def validate(self, value: str):
         if len(value) < self.min_len:
-            raise CustomValidationError(f"Должно быть > {self.min_len} символов!")
+            raise self.error(value)
+
+    def error(self, value):
+        return CustomValidationError(f"Должно быть > {self.min_len} символов!")
+
+    def compile(self):
+        min_len = self.min_len
+        return lambda value: len(value) >= min_len
 
 class HasSpecialCharRule(Rule):
     def __init__(self, chars="!@#$%*"):
@@ -47,13 +88,32 @@ class HasSpecialCharRule(Rule):
 
     def validate(self, value: str):
         if not any(char in self.chars for char in value):
-            raise CustomValidationError(f"Нужен хотя бы 1 символ из {self.chars}")
+            raise self.error(value)
+
+    def error(self, value):
+        return CustomValidationError(f"Нужен хотя бы 1 символ из {self.chars}")
+
+    def compile(self):
+        # isdisjoint проходит по строке на C и останавливается на первом совпадении
+        chars = frozenset(self.chars)
+        return lambda value: not chars.isdisjoint(value)
 
 
 class HasTitleRule(Rule):
     def validate(self, value: str):
         if not any(char.isupper() for char in value):  # Проверяем всю строку
-            raise CustomValidationError("Нужна хотя бы 1 заглавная буква")
+            raise self.error(value)
+
+    def error(self, value):
+        return CustomValidationError("Нужна хотя бы 1 заглавная буква")
+
+    def compile(self):
+        # В ASCII isupper() только у A-Z, и lower() меняет строку ровно тогда, когда они есть
+        def check(value) -> bool:
+            if value.isascii():
+                return value.lower() != value
+            return any(map(str.isupper, value))
+        return check
 
 class MinDigitsRule(Rule):
     def __init__(self, need_digits):
@@ -62,8 +122,82 @@ class MinDigitsRule(Rule):
 
     def validate(self, value: str):
         if sum(c.isdigit() for c in value) < self._digits:
-            raise CustomValidationError("Нужно минимум {} цифры".format(self._digits))  # Альтернативный вариант форматирования
+            raise self.error(value)
+
+    def error(self, value):
+        return CustomValidationError("Нужно минимум {} цифры".format(self._digits))  # Альтернативный вариант форматирования
+
+    def compile(self):
+        need = self._digits
+
+        def check(value) -> bool:
+            if value.isascii():
+                # Число цифр = на сколько укоротилась строка после удаления 0-9
+                return len(value) - len(value.encode().translate(None, _ASCII_DIGITS)) >= need
+            return sum(map(str.isdigit, value)) >= need
+        return check
+
+
+class NotBreachedRule(Rule):
+    """
+    Пароль не должен встречаться в базе утечек. База — фильтр Блума,
+    собранный python -m tasks_for_the_school.bloom: ложные отказы возможны
+    с долей fp_rate, пропусков утёкших паролей нет.
+    Файл открывается через mmap при первой проверке, а при передаче правила
+    в другой процесс (pickle) переоткрывается там — память общая через page cache.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._bloom = None
+
+    @property
+    def bloom(self):
+        if self._bloom is None:
+            # Импорт здесь: без NotBreachedRule модулю фильтра Блума незачем грузиться
+            from tasks_for_the_school.bloom import BloomFilter
+            self._bloom = BloomFilter(self.path)
+        return self._bloom
+
+    def __getstate__(self):
+        return {"path": self.path, "_bloom": None}
+
+    def validate(self, value: str):
+        if value in self.bloom:
+            raise self.error(value)
+
+    def error(self, value):
+        return CustomValidationError("Пароль найден в базе утечек")
+
+    def compile(self):
+        bloom = self.bloom
+        return lambda value: value not in bloom
+
 
+@dataclass
+class ValidationResult:
+    """
+    Итог проверки по всем правилам: нарушения собираются, а не выбрасываются.
+    Хранятся нарушенные правила; CustomValidationError для них строит
+    rule.error при первом обращении к errors — кому нужны только ok или
+    failed_rules, за объекты ошибок не платят.
+    """
+    value: object
+    failed_rules: list[Rule] = field(default_factory=list)
+
+    @cached_property
+    def errors(self) -> list[CustomValidationError]:
+        return [rule.error(self.value) for rule in self.failed_rules]
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed_rules
+
+    def __bool__(self):
+        return self.ok
+
+    def messages(self) -> list[str]:
+        return [error.message for error in self.errors]
 
 
 class CustomValidator:
@@ -72,11 +206,21 @@ class CustomValidator:
     """
     def __init__(self):
         self._rules: list[Rule] = []
+        self._compiled: "CompiledValidator" = None
 
     def add_rule(self, rule: Rule):
         self._rules.append(rule)
+        self._compiled = None
         return self
 
+    def __getstate__(self):
+        # Быстрые проверки — замыкания, они не сериализуются; снимок пересоберётся
+        return {**self.__dict__, "_compiled": None}
+
+    @property
+    def rules(self) -> tuple[Rule, ...]:
+        return tuple(self._rules)
+
     def checks(self, value: T) -> bool:
         """
         Проверяет значение по всем правилам.
@@ -87,6 +231,176 @@ class CustomValidator:
             rule.validate(value)
         return True
 
+    def collect(self, value: T) -> ValidationResult:
+        """
+        Проверяет значение всеми правилами и возвращает все нарушения без исключения.
+        Идёт через быстрые проверки CompiledValidator.collect (снимок правил
+        пересобирается после add_rule), ошибки строит rule.error без raise.
+        """
+        if self._compiled is None:
+            self._compiled = self.compile()
+        return self._compiled.collect(value)
+
+    def compile(self) -> "CompiledValidator":
+        """Снимок текущих правил с быстрыми проверками (см. Rule.compile)"""
+        return CompiledValidator(self._rules)
+
+    def adaptive(self, sample_every: int = 64, reorder_every: int = 4096) -> "AdaptiveValidator":
+        """Снимок правил, которые сами переупорядочиваются по цене и частоте отказов"""
+        return AdaptiveValidator(self._rules, sample_every, reorder_every)
+
+
+class CompiledValidator:
+    """
+    То же, что CustomValidator, но каждое правило заранее превращено
+    в проверку на сишных примитивах вместо генераторов по символам.
+    Для провалившегося правила ошибка берётся из rule.error(value) —
+    та же CustomValidationError с тем же текстом, что выбросил бы validate.
+    Правила, добавленные в CustomValidator после compile(), не учитываются.
+    """
+
+    def __init__(self, rules: list[Rule]):
+        self._rules = list(rules)
+        self._checks = [(rule.compile(), rule) for rule in self._rules]
+
+    @property
+    def rules(self) -> tuple[Rule, ...]:
+        return tuple(self._rules)
+
+    def rule_names(self) -> list[str]:
+        """Имена правил для отчётов; повторяющиеся классы нумеруются: MinLengthRule, MinLengthRule#2"""
+        names, seen = [], {}
+        for rule in self._rules:
+            name = type(rule).__name__
+            seen[name] = seen.get(name, 0) + 1
+            names.append(name if seen[name] == 1 else f"{name}#{seen[name]}")
+        return names
+
+    def batch_failures(self, values: list[T]) -> list[list[int]]:
+        """
+        Пакетная проверка без исключений: для каждого правила (в порядке rules)
+        список индексов значений, которые его не прошли. Проверяются все правила,
+        а не до первой ошибки — для подсчёта нарушений по правилам.
+        """
+        return [
+            [index for index, value in enumerate(values) if not check(value)]
+            for check, _ in self._checks
+        ]
+
+    def is_valid(self, value: T) -> bool:
+        """Проходит ли значение все правила, без исключений"""
+        for check, _ in self._checks:
+            if not check(value):
+                return False
+        return True
+
+    def checks(self, value: T) -> bool:
+        """Как CustomValidator.checks: True или CustomValidationError первого провалившегося правила"""
+        for check, rule in self._checks:
+            if not check(value):
+                raise rule.error(value)
+        return True
+
+    def collect(self, value: T) -> ValidationResult:
+        """
+        Все нарушения без исключений: каждая быстрая проверка вызывается
+        по одному разу, ошибки нарушенных правил строит rule.error(value)
+        (лениво, см. ValidationResult).
+        """
+        return ValidationResult(value, [rule for check, rule in self._checks if not check(value)])
+
+
+class AdaptiveValidator(CompiledValidator):
+    """
+    Короткое замыкание в порядке, который минимизирует среднюю работу на отказ.
+
+    Каждое sample_every-е значение прогоняется через все правила с замером
+    времени — так частота отказов каждого правила не искажается коротким
+    замыканием. Раз в reorder_every значений правила сортируются по
+    цена / вероятность отказа: вперёд идут дешёвые и часто отказывающие.
+    checks() выбрасывает ошибку первого нарушенного правила в текущем
+    порядке — он может отличаться от порядка add_rule. collect() и
+    batch_failures() по-прежнему идут в исходном порядке.
+    Из нескольких потоков статистика копится приблизительно.
+    """
+
+    def __init__(self, rules: list[Rule], sample_every: int = 64, reorder_every: int = 4096):
+        super().__init__(rules)
+        self.sample_every = max(1, sample_every)
+        self.reorder_every = max(1, reorder_every)
+        self._ordered = list(self._checks)
+        # Обратный отсчёт до следующего замера дешевле счётчика с остатком от деления
+        self._countdown = self.sample_every
+        self._samples = 0
+        self._next_reorder = max(1, self.reorder_every // self.sample_every)
+        self._failures = [0] * len(self._checks)
+        self._cost_ns = [0] * len(self._checks)
+
+    def _sample(self, value):
+        self._countdown = self.sample_every
+        self._samples += 1
+        for index, (check, _) in enumerate(self._checks):
+            start = perf_counter_ns()
+            passed = check(value)
+            self._cost_ns[index] += perf_counter_ns() - start
+            if not passed:
+                self._failures[index] += 1
+        if self._samples >= self._next_reorder:
+            self._next_reorder = self._samples + max(1, self.reorder_every // self.sample_every)
+            self.reorder()
+
+    def _score(self, index: int) -> float:
+        # Сглаживание Лапласа: правило без отказов в выборке не получает бесконечную цену
+        fail_rate = (self._failures[index] + 1) / (self._samples + 2)
+        return self._cost_ns[index] / max(self._samples, 1) / fail_rate
+
+    def reorder(self):
+        order = sorted(range(len(self._checks)), key=self._score)
+        self._ordered = [self._checks[index] for index in order]
+
+    def order(self) -> list[str]:
+        """Имена правил в текущем порядке проверки"""
+        names = dict(zip(map(id, self._rules), self.rule_names()))
+        return [names[id(rule)] for _, rule in self._ordered]
+
+    def stats(self) -> dict[str, dict]:
+        samples = max(self._samples, 1)
+        return {
+            name: {
+                "fail_rate": self._failures[index] / samples,
+                "mean_ns": self._cost_ns[index] / samples,
+            }
+            for index, name in enumerate(self.rule_names())
+        }
+
+    def is_valid(self, value: T) -> bool:
+        self._countdown -= 1
+        if not self._countdown:
+            self._sample(value)
+        for check, _ in self._ordered:
+            if not check(value):
+                return False
+        return True
+
+    def checks(self, value: T) -> bool:
+        self._countdown -= 1
+        if not self._countdown:
+            self._sample(value)
+        for check, rule in self._ordered:
+            if not check(value):
+                raise rule.error(value)
+        return True
+
+
+def default_validator(min_len: int = 10, chars: str = "!@#$%*", min_digits: int = 3) -> CustomValidator:
+    """Четыре правила из условия задачи"""
+    return (
+        CustomValidator()
+        .add_rule(MinLengthRule(min_len))
+        .add_rule(HasSpecialCharRule(chars))
+        .add_rule(HasTitleRule())
+        .add_rule(MinDigitsRule(min_digits))
+    )
 
 
 if __name__ == "__main__":
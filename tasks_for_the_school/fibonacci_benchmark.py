@@ -0,0 +1,80 @@
+"""
+Бенчмарк fibonacci_num: линейный fib_generator против nth() с быстрым удвоением.
+
+Для каждого n замеряется последнее число генератора (только до --generator-limit,
+дальше он слишком долгий), nth(n) с холодным кэшем, повторный nth(n) и
+соседний nth(n + 1000) (через контрольную точку), а также nth(n, mod).
+
+Запуск:
+    python -m tasks_for_the_school.fibonacci_benchmark --max-n 10000000
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from tasks_for_the_school.fibonacci_num import clear_checkpoints, fib_generator, nth
+
+MOD = 1_000_000_007
+
+
+def _timed(func, *args) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def _last(iterable):
+    value = None
+    for value in iterable:
+        pass
+    return value
+
+
+def run_suite(max_n: int = 1_000_000, generator_limit: int = 100_000) -> list[dict]:
+    rows = []
+    n = 1_000
+    while n <= max_n:
+        clear_checkpoints()
+        row = {"n": n}
+        row["nth_sec"], value = _timed(nth, n)
+        row["nth_cached_sec"], _ = _timed(nth, n)
+        row["nth_near_sec"], _ = _timed(nth, n + 1_000)
+        row["nth_mod_sec"], _ = _timed(nth, n, MOD)
+        row["bits"] = value.bit_length()
+        if n <= generator_limit:
+            # fib_generator(n - 1) заканчивается на F(n)
+            row["generator_sec"], last = _timed(_last, fib_generator(n - 1))
+            assert last == value
+        rows.append(row)
+        n *= 10
+    return rows
+
+
+def format_table(rows: list[dict]) -> str:
+    lines = [f"{'n':>10}{'генератор, с':>14}{'nth, с':>10}{'повтор, с':>11}{'n+1000, с':>11}{'mod, с':>10}"]
+    for row in rows:
+        generator = f"{row['generator_sec']:>14.4f}" if "generator_sec" in row else f"{'—':>14}"
+        lines.append(f"{row['n']:>10}{generator}{row['nth_sec']:>10.4f}{row['nth_cached_sec']:>11.6f}"
+                     f"{row['nth_near_sec']:>11.4f}{row['nth_mod_sec']:>10.6f}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарк чисел Фибоначчи: генератор против быстрого удвоения")
+    parser.add_argument("--max-n", type=int, default=1_000_000)
+    parser.add_argument("--generator-limit", type=int, default=100_000, help="до какого n запускать генератор")
+    parser.add_argument("--json", help="куда сохранить результат в JSON")
+    args = parser.parse_args(argv)
+
+    rows = run_suite(args.max_n, args.generator_limit)
+    print(format_table(rows))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(rows, file, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
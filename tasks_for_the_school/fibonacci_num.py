@@ -1,3 +1,13 @@
+from collections import OrderedDict
+from functools import lru_cache
+
+# Сколько последних (n, F(n), F(n+1)) держать для быстрых повторных запросов;
+# при n ~ 10^7 одна запись занимает ~1.7 МБ
+CHECKPOINTS = 64
+# Период Пизано ищется перебором до 6 * mod шагов — только для небольших mod
+PISANO_LIMIT = 1 << 16
+
+_checkpoints: OrderedDict = OrderedDict()
 
 
 def fib_generator(n: int):
@@ -6,9 +16,99 @@ def fib_generator(n: int):
         a, b = b, a + b
         yield b
 
+
+@lru_cache(maxsize=128)
+def pisano(mod: int) -> int:
+    """Период последовательности Фибоначчи по модулю mod (не больше 6 * mod)"""
+    if mod == 1:
+        return 1
+    a, b = 0, 1
+    for period in range(1, 6 * mod + 1):
+        a, b = b, (a + b) % mod
+        if a == 0 and b == 1:
+            return period
+    raise AssertionError(f"период Пизано для {mod} не найден")
+
+
+def _doubling(n: int, mod: int = None) -> tuple[int, int]:
+    """(F(n), F(n+1)) быстрым удвоением: F(2k) = F(k)(2F(k+1) - F(k)), F(2k+1) = F(k)² + F(k+1)²"""
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if mod is not None:
+            c %= mod
+            d %= mod
+        if bit == "1":
+            a, b = d, c + d
+            if mod is not None:
+                b %= mod
+        else:
+            a, b = c, d
+    return a, b
+
+
+def _nearest_checkpoint(n: int, mod: int = None):
+    best = None
+    for key in _checkpoints:
+        if key[1] == mod and key[0] <= n and (best is None or key[0] > best[0]):
+            best = key
+    return best
+
+
+def fib_pair(n: int, mod: int = None) -> tuple[int, int]:
+    """
+    (F(n), F(n+1)), при mod — по модулю. Недавние результаты хранятся
+    в LRU на CHECKPOINTS записей: если есть сохранённое k <= n и n - k <= k,
+    ответ собирается из него и пары для n - k по формуле сложения:
+        F(k+d) = F(k+1)F(d) + F(k)(F(d+1) - F(d)),  F(k+d+1) = F(k+1)F(d+1) + F(k)F(d)
+    """
+    if n < 0:
+        raise ValueError("n должно быть >= 0")
+    if mod is not None:
+        if mod < 1:
+            raise ValueError("mod должно быть >= 1")
+        if mod <= PISANO_LIMIT:
+            n %= pisano(mod)
+
+    key = (n, mod)
+    pair = _checkpoints.get(key)
+    if pair is not None:
+        _checkpoints.move_to_end(key)
+        return pair
+
+    nearest = _nearest_checkpoint(n, mod)
+    if nearest is not None and n - nearest[0] <= nearest[0]:
+        fk, fk1 = _checkpoints[nearest]
+        fd, fd1 = _doubling(n - nearest[0], mod)
+        pair = fk1 * fd + fk * (fd1 - fd), fk1 * fd1 + fk * fd
+        if mod is not None:
+            pair = pair[0] % mod, pair[1] % mod
+    else:
+        pair = _doubling(n, mod)
+
+    _checkpoints[key] = pair
+    if len(_checkpoints) > CHECKPOINTS:
+        _checkpoints.popitem(last=False)
+    return pair
+
+
+def nth(n: int, mod: int = None) -> int:
+    """
+    n-е число Фибоначчи (F(0) = 0, F(1) = 1) за O(log n) умножений, при mod — по модулю.
+    fib_generator(n) выдаёт nth(2), ..., nth(n + 1).
+    """
+    return fib_pair(n, mod)[0]
+
+
+def clear_checkpoints():
+    _checkpoints.clear()
+
+
 if __name__ == "__main__":
 
     LIMIT = int(input("Введите число: "))
 
-    for i, num in enumerate(list(fib_generator(LIMIT))):
-        print("Fibonacci Numbers №{}: {}".format(i+1, num))
\ No newline at end of file
+    # Числа печатаются по мере вычисления, список целиком не строится
+    for i, num in enumerate(fib_generator(LIMIT)):
+        print("Fibonacci Numbers №{}: {}".format(i+1, num))
@@ -0,0 +1,206 @@
+"""
+Массовая проверка паролей из файла (по одному на строку) правилами check_password.
+
+Файл читается блоками по chunk_bytes, дополненными до конца строки; блоки
+проверяются в пуле процессов через CompiledValidator.batch_failures — без
+исключения на каждое невалидное значение. В работе одновременно не больше
+2 * workers блоков, так что память не зависит от размера файла.
+
+Результат — число строк, невалидных строк и нарушений по каждому правилу;
+с --lines номера невалидных строк и их правила пишутся в TSV по порядку:
+
+    python -m tasks_for_the_school.password_audit dump.txt --workers 4 --lines bad.tsv --json report.json
+    zcat dump.txt.gz | python -m tasks_for_the_school.password_audit - --min-len 12
+"""
+
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import json
+import os
+import sys
+from typing import BinaryIO, Iterator, TextIO
+
+from tasks_for_the_school.check_password import (
+    CompiledValidator,
+    CustomValidator,
+    NotBreachedRule,
+    Rule,
+    default_validator,
+)
+
+CHUNK_BYTES = 4 * 1024 * 1024
+
+
+@dataclass
+class AuditReport:
+    rules: list[str]
+    total: int = 0
+    invalid: int = 0
+    failures: dict[str, int] = field(default_factory=dict)
+
+    def __post_init__(self):
+        for name in self.rules:
+            self.failures.setdefault(name, 0)
+
+    def summary(self) -> dict:
+        return {"total": self.total, "invalid": self.invalid, "failures": dict(self.failures)}
+
+
+@dataclass
+class ChunkResult:
+    first_line: int
+    size: int
+    # для каждого правила — номера строк (с 1), которые его не прошли
+    failed_lines: list[list[int]]
+
+
+def decode_lines(block: bytes) -> list[str]:
+    """Строки блока без перевода строки; невалидный UTF-8 не роняет проверку"""
+    text = block.decode("utf-8", "surrogateescape")
+    # CRLF — до снятия последнего перевода строки, иначе у последней строки останется "\r"
+    if "\r" in text:
+        text = text.replace("\r\n", "\n")
+    if text.endswith("\n"):
+        text = text[:-1]
+    return text.split("\n")
+
+
+def iter_chunks(stream: BinaryIO, chunk_bytes: int = CHUNK_BYTES) -> Iterator[tuple[int, bytes]]:
+    """Пары (номер первой строки, блок целых строк)"""
+    line = 1
+    while True:
+        block = stream.read(chunk_bytes)
+        if not block:
+            return
+        if not block.endswith(b"\n"):
+            block += stream.readline()
+        yield line, block
+        line += block.count(b"\n") + (not block.endswith(b"\n"))
+
+
+def check_chunk(validator: CompiledValidator, first_line: int, block: bytes) -> ChunkResult:
+    values = decode_lines(block)
+    failed = validator.batch_failures(values)
+    return ChunkResult(first_line, len(values), [[first_line + index for index in indexes] for indexes in failed])
+
+
+# Состояние процесса-исполнителя: правила компилируются один раз в каждом процессе
+_validator: CompiledValidator = None
+
+
+def _init_worker(rules: tuple[Rule, ...]):
+    global _validator
+    _validator = CompiledValidator(rules)
+
+
+def _check_chunk(task) -> ChunkResult:
+    first_line, block = task
+    return check_chunk(_validator, first_line, block)
+
+
+def _map_bounded(pool: ProcessPoolExecutor, func, tasks, window: int) -> Iterator:
+    """pool.map с ограниченным числом задач в работе: Executor.map читает вход целиком"""
+    pending = deque()
+    for task in tasks:
+        pending.append(pool.submit(func, task))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def write_failed_lines(out: TextIO, result: ChunkResult, names: list[str]):
+    by_line: dict[int, list[str]] = {}
+    for name, lines in zip(names, result.failed_lines):
+        for line in lines:
+            by_line.setdefault(line, []).append(name)
+    for line in sorted(by_line):
+        out.write(f"{line}\t{','.join(by_line[line])}\n")
+
+
+def audit_stream(
+    stream: BinaryIO,
+    validator: CustomValidator = None,
+    workers: int = None,
+    chunk_bytes: int = CHUNK_BYTES,
+    lines_out: TextIO = None,
+) -> AuditReport:
+    """
+    Проверяет все строки двоичного потока. workers=1 — в текущем процессе.
+    lines_out — куда писать "номер<TAB>правила" для невалидных строк.
+    """
+    rules = (validator or default_validator()).rules
+    compiled = CompiledValidator(rules)
+    names = compiled.rule_names()
+    report = AuditReport(names)
+    chunks = iter_chunks(stream, chunk_bytes)
+
+    def consume(results):
+        for result in results:
+            report.total += result.size
+            report.invalid += len(set().union(*result.failed_lines))
+            for name, lines in zip(names, result.failed_lines):
+                report.failures[name] += len(lines)
+            if lines_out is not None:
+                write_failed_lines(lines_out, result, names)
+
+    if workers == 1:
+        consume(check_chunk(compiled, first_line, block) for first_line, block in chunks)
+    else:
+        workers = workers or os.cpu_count()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(rules,)) as pool:
+            consume(_map_bounded(pool, _check_chunk, chunks, 2 * workers))
+    return report
+
+
+def audit_file(path, validator: CustomValidator = None, workers: int = None,
+               chunk_bytes: int = CHUNK_BYTES, lines_out: TextIO = None) -> AuditReport:
+    with open(path, "rb") as stream:
+        return audit_stream(stream, validator, workers, chunk_bytes, lines_out)
+
+
+def format_report(report: AuditReport) -> str:
+    lines = [f"строк: {report.total}, невалидных: {report.invalid}"]
+    for name, count in report.failures.items():
+        share = count / report.total if report.total else 0.0
+        lines.append(f"{name:<24}{count:>12}{share:>9.1%}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Массовая проверка паролей из файла")
+    parser.add_argument("path", help="файл с паролями по одному на строку, '-' — stdin")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk-bytes", type=int, default=CHUNK_BYTES, help="размер блока для одного процесса")
+    parser.add_argument("--min-len", type=int, default=10)
+    parser.add_argument("--special", default="!@#$%*", help="допустимые спецсимволы")
+    parser.add_argument("--min-digits", type=int, default=3)
+    parser.add_argument("--breached", help="фильтр Блума утёкших паролей (python -m tasks_for_the_school.bloom)")
+    parser.add_argument("--lines", help="TSV с номерами невалидных строк и нарушенными правилами")
+    parser.add_argument("--json", help="сохранить итоговые счётчики в JSON")
+    args = parser.parse_args(argv)
+
+    validator = default_validator(args.min_len, args.special, args.min_digits)
+    if args.breached:
+        validator.add_rule(NotBreachedRule(args.breached))
+    lines_out = open(args.lines, "w", encoding="utf-8") if args.lines else None
+    try:
+        if args.path == "-":
+            report = audit_stream(sys.stdin.buffer, validator, args.workers, args.chunk_bytes, lines_out)
+        else:
+            report = audit_file(args.path, validator, args.workers, args.chunk_bytes, lines_out)
+    finally:
+        if lines_out is not None:
+            lines_out.close()
+
+    print(format_report(report))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(report.summary(), file, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
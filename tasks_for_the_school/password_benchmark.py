@@ -0,0 +1,138 @@
+"""
+Бенчмарк проверки паролей: CustomValidator.checks (правило за правилом,
+генераторы по символам) против CustomValidator.compile(), адаптивного
+порядка правил (adaptive) и сбора всех нарушений (collect).
+
+Наборы паролей генерируются с фиксированным seed: только валидные,
+только невалидные и смесь. Для каждого способа берётся лучший из repeat
+прогонов по всему набору, результат — наносекунды на пароль.
+
+Запуск:
+    python -m tasks_for_the_school.password_benchmark --size 20000 --json bench.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import string
+import sys
+import time
+
+from tasks_for_the_school.check_password import CustomValidationError, default_validator
+
+
+def make_password(rng: random.Random, valid: bool, weights=(1, 1, 1, 1)) -> str:
+    """Валидный пароль или пароль, ломающий одно правило (выбор по weights)"""
+    length = rng.randint(10, 24)
+    chars = [rng.choice(string.ascii_lowercase) for _ in range(length)]
+    positions = rng.sample(range(length), 5)
+    chars[positions[0]] = rng.choice("!@#$%*")
+    chars[positions[1]] = rng.choice(string.ascii_uppercase)
+    for position in positions[2:]:
+        chars[position] = rng.choice(string.digits)
+    if not valid:
+        broken = rng.choices(range(4), weights)[0]
+        if broken == 0:
+            chars = chars[:rng.randint(0, 9)]
+        elif broken == 1:
+            chars = [char if char not in "!@#$%*" else "x" for char in chars]
+        elif broken == 2:
+            chars = [char.lower() for char in chars]
+        else:
+            chars = [char if not char.isdigit() else "y" for char in chars]
+    return "".join(chars)
+
+
+def make_corpus(size: int, valid_share: float, seed: int = 0, weights=(1, 1, 1, 1)) -> list[str]:
+    rng = random.Random(seed)
+    return [make_password(rng, rng.random() < valid_share, weights) for _ in range(size)]
+
+
+def _count_valid(checks, passwords: list[str]) -> int:
+    valid = 0
+    for password in passwords:
+        try:
+            checks(password)
+        except CustomValidationError:
+            pass
+        else:
+            valid += 1
+    return valid
+
+
+def _count_is_valid(is_valid, passwords: list[str]) -> int:
+    return sum(map(is_valid, passwords))
+
+
+def _count_collected(collect, passwords: list[str]) -> int:
+    return sum(collect(password).ok for password in passwords)
+
+
+def _count_collected_errors(collect, passwords: list[str]) -> int:
+    # С объектами ошибок для каждого нарушения — сравнимо с rules, где ошибка одна
+    return sum(not collect(password).errors for password in passwords)
+
+
+def run_suite(size: int = 20_000, repeat: int = 5, seed: int = 0) -> dict:
+    validator = default_validator()
+    compiled = validator.compile()
+    methods = {
+        "rules": (_count_valid, validator.checks),
+        "compiled": (_count_valid, compiled.checks),
+        "is_valid": (_count_is_valid, compiled.is_valid),
+        "adaptive": (_count_is_valid, validator.adaptive().is_valid),
+        "collect": (_count_collected, compiled.collect),
+        "collect+err": (_count_collected_errors, compiled.collect),
+    }
+    # "digits": почти все отказы — от последнего правила, MinDigitsRule
+    corpora = {"valid": (1.0, None), "mixed": (0.5, None), "invalid": (0.0, None), "digits": (0.1, (1, 1, 1, 30))}
+    results = {}
+    for corpus_name, (valid_share, weights) in corpora.items():
+        passwords = make_corpus(size, valid_share, seed, weights or (1, 1, 1, 1))
+        results[corpus_name] = {}
+        for method_name, (runner, checks) in methods.items():
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter_ns()
+                valid = runner(checks, passwords)
+                best = min(best, time.perf_counter_ns() - start)
+            results[corpus_name][method_name] = {"ns_per_value": best / size, "valid": valid}
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "size": size,
+        "repeat": repeat,
+        "corpora": results,
+    }
+
+
+def format_table(report: dict) -> str:
+    lines = [f"Python {report['python']} ({report['implementation']}), {report['size']} паролей"]
+    lines.append(f"{'набор':<10}{'способ':<12}{'ns/пароль':>12}{'ускорение':>12}")
+    for corpus_name, methods in report["corpora"].items():
+        baseline = methods["rules"]["ns_per_value"]
+        for method_name, stats in methods.items():
+            lines.append(f"{corpus_name:<10}{method_name:<12}{stats['ns_per_value']:>12.1f}"
+                         f"{baseline / stats['ns_per_value']:>11.1f}x")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарк CustomValidator против скомпилированных правил")
+    parser.add_argument("--size", type=int, default=20_000, help="паролей в наборе")
+    parser.add_argument("--repeat", type=int, default=5, help="количество прогонов")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="куда сохранить результат в JSON")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.size, args.repeat, args.seed)
+    print(format_table(report))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
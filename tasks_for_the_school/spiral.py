@@ -3,10 +3,15 @@
 # [7, 6, 5]
 
 
+import argparse
+import sys
+from typing import Iterator, TextIO
+
 import numpy as np
 
 
-def create_spiral(n):
+def create_spiral_loop(n):
+    """Исходная версия: клетка за клеткой с проверкой границ — эталон для тестов"""
     matrix = np.zeros((n, n), dtype=int)
     directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # право, низ, лево, верх
     current_dir = 0
@@ -30,9 +35,120 @@ def create_spiral(n):
     return matrix
 
 
-# Тестируем для n=3
-spiral = create_spiral(4)
-print(spiral)
+def _ring_tables(n):
+    """
+    Для каждого кольца k: первое число 4k(n - k) + 1 и константы, из которых
+    значения на левой (L[k] - i) и правой (R[k] + i) сторонах кольца в строке i.
+    """
+    k = np.arange((n + 1) // 2, dtype=np.int64)
+    side = n - 2 * k
+    start = 4 * k * (n - k) + 1
+    left = start + 3 * (side - 1) + (n - 1 - k)
+    right = start + side - 1 - k
+    return start, left, right
+
+
+def _fill_row(n, i, tables, out):
+    """
+    Строка i: слева — левые стороны колец 0..m-1, посередине — верх или низ
+    кольца m = min(i, n-1-i), справа — правые стороны колец m-1..0.
+    """
+    start, left, right = tables
+    m = min(i, n - 1 - i)
+    side = n - 2 * m
+    out[:m] = left[:m] - i
+    if i == m:
+        out[m:n - m] = np.arange(start[m], start[m] + side)
+    else:
+        # Нижняя сторона идёт справа налево от 2(side - 1) до 3(side - 1)
+        first = start[m] + 3 * (side - 1)
+        out[m:n - m] = np.arange(first, first - side, -1)
+    out[n - m:] = (right[:m] + i)[::-1]
+
+
+def spiral_value(n, i, j):
+    """Число в клетке (i, j) спирали n×n за O(1), без матрицы"""
+    if not (0 <= i < n and 0 <= j < n):
+        raise IndexError(f"({i}, {j}) вне матрицы {n}×{n}")
+    k = min(i, j, n - 1 - i, n - 1 - j)
+    side = n - 2 * k
+    last = n - 1 - k
+    start = 4 * k * (n - k) + 1
+    if i == k:
+        return start + j - k
+    if j == last:
+        return start + side - 1 + i - k
+    if i == last:
+        return start + 2 * (side - 1) + last - j
+    return start + 3 * (side - 1) + last - i
+
+
+def iter_rows(n, first=0, stop=None, dtype=int) -> Iterator[np.ndarray]:
+    """
+    Строки спирали по одной: память — O(n) на строку и таблицы колец,
+    а не n² на матрицу. Каждая строка — новый массив, его можно сохранить.
+    """
+    tables = _ring_tables(n)
+    for i in range(first, n if stop is None else stop):
+        row = np.empty(n, dtype=dtype)
+        _fill_row(n, i, tables, row)
+        yield row
+
+
+def write_spiral(n, out: TextIO, sep=" "):
+    """Пишет спираль текстом, строка за строкой (в файл, сокет через makefile, stdout)"""
+    for row in iter_rows(n):
+        out.write(sep.join(map(str, row.tolist())))
+        out.write("\n")
+
+
+def spiral_rows(n, first, stop, dtype=int):
+    """Строки first..stop-1 спирали n×n без построения остальной матрицы"""
+    tables = _ring_tables(n)
+    rows = np.empty((max(0, stop - first), n), dtype=dtype)
+    for i in range(first, stop):
+        _fill_row(n, i, tables, rows[i - first])
+    return rows
+
+
+def create_spiral(n, path=None, dtype=int):
+    """
+    Спираль n×n, заполняемая по строкам срезами (O(n) вызовов NumPy вместо n²
+    шагов в Python). С path матрица пишется прямо в .npy через np.memmap:
+    запись идёт подряд, строка за строкой, а не столбцами колец через весь
+    файл, так что в памяти не бывает больше нескольких строк.
+    Открыть результат: np.load(path, mmap_mode="r").
+    """
+    if n * n > np.iinfo(dtype).max:
+        raise ValueError(f"{n}×{n} не помещается в {np.dtype(dtype)}")
+    if path is None:
+        matrix = np.empty((n, n), dtype=dtype)
+    else:
+        matrix = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(n, n))
+    tables = _ring_tables(n)
+    for i in range(n):
+        _fill_row(n, i, tables, matrix[i])
+    if path is not None:
+        matrix.flush()
+    return matrix
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Спиральная матрица n×n")
+    parser.add_argument("n", type=int, nargs="?", default=4)
+    parser.add_argument("--at", type=int, nargs=2, metavar=("I", "J"), help="только число в клетке (I, J)")
+    parser.add_argument("--stream", action="store_true", help="вывести строки текстом по одной, без матрицы в памяти")
+    args = parser.parse_args(argv)
 
+    if args.at:
+        print(spiral_value(args.n, *args.at))
+    elif args.stream:
+        write_spiral(args.n, sys.stdout)
+    else:
+        # Тестируем для n=4
+        print(create_spiral(args.n))
+    return 0
 
 
+if __name__ == "__main__":
+    sys.exit(main())
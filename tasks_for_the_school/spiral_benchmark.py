@@ -0,0 +1,67 @@
+"""
+Бенчмарк spiral: исходный create_spiral_loop против построчного create_spiral
+в памяти и в np.memmap (.npy во временном каталоге).
+
+Запуск:
+    python -m tasks_for_the_school.spiral_benchmark --sizes 100 500 5000 20000
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from tasks_for_the_school.spiral import create_spiral, create_spiral_loop
+
+
+def run_suite(sizes: list[int], loop_limit: int = 500, memmap_dtype=np.int32) -> list[dict]:
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            row = {"n": n}
+            if n <= loop_limit:
+                start = time.perf_counter()
+                create_spiral_loop(n)
+                row["loop_sec"] = time.perf_counter() - start
+            start = time.perf_counter()
+            create_spiral(n)
+            row["vectorized_sec"] = time.perf_counter() - start
+            path = os.path.join(tmp, f"spiral_{n}.npy")
+            start = time.perf_counter()
+            matrix = create_spiral(n, path, dtype=memmap_dtype)
+            row["memmap_sec"] = time.perf_counter() - start
+            del matrix
+            os.remove(path)
+            rows.append(row)
+    return rows
+
+
+def format_table(rows: list[dict]) -> str:
+    lines = [f"{'n':>8}{'цикл, с':>12}{'срезы, с':>12}{'memmap, с':>12}"]
+    for row in rows:
+        loop = f"{row['loop_sec']:>12.4f}" if "loop_sec" in row else f"{'—':>12}"
+        lines.append(f"{row['n']:>8}{loop}{row['vectorized_sec']:>12.4f}{row['memmap_sec']:>12.4f}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарк построения спиральной матрицы")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 2000, 10000])
+    parser.add_argument("--loop-limit", type=int, default=500, help="до какого n запускать исходный цикл")
+    parser.add_argument("--json", help="куда сохранить результат в JSON")
+    args = parser.parse_args(argv)
+
+    rows = run_suite(args.sizes, args.loop_limit)
+    print(format_table(rows))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(rows, file, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
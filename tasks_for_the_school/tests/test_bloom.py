@@ -0,0 +1,67 @@
+import pickle
+
+import pytest
+
+from tasks_for_the_school.bloom import BloomFilter, build, main, optimal_params
+from tasks_for_the_school.check_password import CustomValidationError, NotBreachedRule, default_validator
+
+N = 20_000
+
+
+@pytest.fixture
+def breached(tmp_path):
+    source = tmp_path / "breached.txt"
+    source.write_bytes(b"".join(f"leaked{i}\r\n".encode() for i in range(N)) + b"Aa12345!qwery\n\xffraw\n")
+    target = tmp_path / "breached.bloom"
+    build(source, target, fp_rate=0.01).close()
+    return target
+
+
+def test_no_false_negatives_and_fp_rate_near_target(breached):
+    with BloomFilter(breached) as bloom:
+        assert bloom.count == N + 2
+        assert all(f"leaked{i}" in bloom for i in range(N))
+        assert b"\xffraw" in bloom and "\udcffraw" in bloom  # невалидный UTF-8 как в password_audit
+
+        false_positives = sum(f"clean{i}" in bloom for i in range(N))
+        assert false_positives / N < 0.015
+        assert bloom.expected_fp_rate() == pytest.approx(0.01, rel=0.2)
+
+
+@pytest.mark.parametrize("fp_rate", [0.1, 0.001])
+def test_optimal_params_reach_fp_rate(tmp_path, fp_rate):
+    bloom = BloomFilter.create(tmp_path / "f.bloom", 5_000, fp_rate)
+    bloom.update(f"item{i}" for i in range(5_000))
+    measured = sum(f"other{i}" in bloom for i in range(50_000)) / 50_000
+    bloom.close()
+    assert measured < fp_rate * 1.5
+    assert optimal_params(5_000, fp_rate)[0] == bloom.bits
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "not.bloom"
+    path.write_bytes(b"x" * 64)
+    with pytest.raises(ValueError):
+        BloomFilter(path)
+
+
+def test_rule_in_validator_and_after_pickle(breached):
+    rule = NotBreachedRule(breached)
+    validator = default_validator().add_rule(rule)
+    compiled = validator.compile()
+
+    assert not compiled.is_valid("Aa12345!qwery")
+    assert compiled.is_valid("Bb67890!zxcvb")
+    with pytest.raises(CustomValidationError, match="утечек"):
+        compiled.checks("Aa12345!qwery")
+
+    clone = pickle.loads(pickle.dumps(rule))
+    assert clone._bloom is None
+    assert clone.compile()("leaked7") is False
+
+
+def test_cli(tmp_path, capsys):
+    source = tmp_path / "breached.txt"
+    source.write_text("one\ntwo\n\nthree\n", encoding="utf-8")
+    assert main([str(source), str(tmp_path / "b.bloom")]) == 0
+    assert capsys.readouterr().out.startswith("3 паролей")
@@ -0,0 +1,86 @@
+from pathlib import Path
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from tasks_for_the_school.check_password import CustomValidationError, CustomValidator, Rule, default_validator
+from tasks_for_the_school.password_benchmark import make_corpus
+
+UNICODE_CASES = ["Пароль!١٢٣abc", "ПАРОЛЬ!12", "ǅabcdefgh!123", "Ⅻ!aaaaaaaa²³⁴", "ß!aaaaaa123", "x" * 9 + "!", ""]
+
+
+def outcome(checks, value):
+    try:
+        return checks(value)
+    except CustomValidationError as error:
+        return str(error)
+
+
+@pytest.mark.parametrize("value", make_corpus(500, 0.5) + UNICODE_CASES)
+def test_compiled_matches_rule_by_rule(value):
+    validator = default_validator()
+    compiled = validator.compile()
+
+    expected = outcome(validator.checks, value)
+    assert outcome(compiled.checks, value) == expected
+    assert compiled.is_valid(value) is (expected is True)
+
+
+class NoSpacesRule(Rule):
+    def validate(self, value: str):
+        if " " in value:
+            raise CustomValidationError("Без пробелов")
+
+
+def test_rule_without_compile_falls_back_to_validate():
+    validator = CustomValidator().add_rule(NoSpacesRule())
+    compiled = validator.compile()
+    validator.add_rule(NoSpacesRule())  # снимок: на compiled не влияет
+
+    assert compiled.is_valid("abc")
+    with pytest.raises(CustomValidationError, match="Без пробелов"):
+        compiled.checks("a b")
+    assert len(compiled._checks) == 1
+
+
+def test_collect_returns_every_violation():
+    validator = default_validator()
+    for collect in (validator.collect, validator.compile().collect):
+        result = collect("short")
+        assert not result
+        assert [type(rule).__name__ for rule in result.failed_rules] == [
+            "MinLengthRule", "HasSpecialCharRule", "HasTitleRule", "MinDigitsRule",
+        ]
+        assert result.messages()[0] == "Должно быть > 10 символов!"
+        assert collect("Aa12345!qwery").ok
+
+
+def test_collect_sees_rules_added_later():
+    validator = CustomValidator().add_rule(NoSpacesRule())
+    assert validator.collect("a b").messages() == ["Без пробелов"]
+    validator.add_rule(NoSpacesRule())
+    assert validator.collect("a b").messages() == ["Без пробелов"] * 2
+    assert pickle.loads(pickle.dumps(validator)).collect("a b").messages() == ["Без пробелов"] * 2
+
+
+def test_adaptive_moves_frequent_failures_first():
+    adaptive = default_validator().adaptive(sample_every=4, reorder_every=64)
+    passwords = make_corpus(2_000, 0.1, weights=(0, 0, 0, 1))  # отказывает только MinDigitsRule
+
+    assert [adaptive.is_valid(value) for value in passwords] == [
+        default_validator().compile().is_valid(value) for value in passwords
+    ]
+    assert adaptive.order()[0] == "MinDigitsRule"
+    assert adaptive.stats()["MinDigitsRule"]["fail_rate"] > 0.8
+    assert adaptive.stats()["MinLengthRule"]["fail_rate"] == 0
+    with pytest.raises(CustomValidationError, match="цифры"):
+        adaptive.checks("short")  # MinLengthRule тоже нарушено, но проверяется позже
+
+
+def test_demo_runs_as_script():
+    script = Path(__file__).resolve().parents[1] / "check_password.py"
+    result = subprocess.run([sys.executable, str(script)], capture_output=True, text=True, cwd=script.parent)
+    assert result.returncode == 0, result.stderr
+    assert "Aa12345!qwery is valid!" in result.stdout
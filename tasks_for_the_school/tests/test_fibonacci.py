@@ -0,0 +1,42 @@
+import pytest
+
+from tasks_for_the_school import fibonacci_num
+from tasks_for_the_school.fibonacci_num import clear_checkpoints, fib_generator, fib_pair, nth, pisano
+
+
+@pytest.fixture(autouse=True)
+def fresh_checkpoints():
+    clear_checkpoints()
+    yield
+    clear_checkpoints()
+
+
+def test_nth_matches_generator():
+    assert nth(0) == 0 and nth(1) == 1
+    assert [nth(n) for n in range(2, 302)] == list(fib_generator(300))
+
+
+@pytest.mark.parametrize("mod", [1, 2, 10, 1000, 1_000_000_007])
+def test_modular_matches_exact(mod):
+    for n in (0, 1, 2, 59, 60, 61, 1000, 12345):
+        assert nth(n, mod) == nth(n) % mod
+
+
+def test_pisano_periods():
+    assert [pisano(mod) for mod in (1, 2, 3, 5, 10, 100)] == [1, 3, 8, 20, 60, 300]
+
+
+def test_checkpoints_give_same_answers_and_stay_bounded(monkeypatch):
+    monkeypatch.setattr(fibonacci_num, "CHECKPOINTS", 4)
+    expected = {n: fibonacci_num._doubling(n) for n in range(5000, 5020)}
+    for n in range(5000, 5020):
+        assert fib_pair(n) == expected[n]
+    assert fib_pair(9999, mod=97) == tuple(value % 97 for value in fibonacci_num._doubling(9999))
+    assert len(fibonacci_num._checkpoints) == 4
+
+
+def test_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        nth(-1)
+    with pytest.raises(ValueError):
+        nth(5, mod=0)
@@ -0,0 +1,83 @@
+import io
+
+import pytest
+
+from tasks_for_the_school.bloom import build
+from tasks_for_the_school.check_password import CustomValidationError, default_validator
+from tasks_for_the_school.password_audit import audit_file, audit_stream, decode_lines, main
+from tasks_for_the_school.password_benchmark import make_corpus
+
+
+def expected_failures(passwords):
+    """Эталон: каждое правило по отдельности через validate"""
+    rules = default_validator().rules
+    failed = {}
+    for line, password in enumerate(passwords, 1):
+        for rule in rules:
+            try:
+                rule.validate(password)
+            except CustomValidationError:
+                failed.setdefault(line, []).append(type(rule).__name__)
+    return failed
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_audit_matches_rule_by_rule(tmp_path, workers):
+    passwords = make_corpus(2_000, 0.3, seed=5)
+    path = tmp_path / "dump.txt"
+    path.write_text("\n".join(passwords) + "\n", encoding="utf-8")
+    expected = expected_failures(passwords)
+
+    lines_out = io.StringIO()
+    report = audit_file(path, workers=workers, chunk_bytes=1_000, lines_out=lines_out)
+
+    assert report.total == len(passwords)
+    assert report.invalid == len(expected)
+    for name, count in report.failures.items():
+        assert count == sum(name in rules for rules in expected.values())
+    written = [line.split("\t") for line in lines_out.getvalue().splitlines()]
+    assert [(int(line), rules.split(",")) for line, rules in written] == sorted(expected.items())
+
+
+def test_crlf_empty_lines_and_bad_utf8():
+    data = b"Aa12345!qwery\r\n\r\nAa12345!qw\xffery\r\n"
+    report = audit_stream(io.BytesIO(data), workers=1, chunk_bytes=4)
+
+    assert report.total == 3
+    assert report.invalid == 1
+    assert report.failures["MinLengthRule"] == 1
+
+
+@pytest.mark.parametrize("chunk_bytes", [4, 1_000])
+def test_crlf_is_not_part_of_password(chunk_bytes):
+    # 9 символов — короче нужного; с "\r" было бы 10 и правило бы прошло
+    data = b"Aa12345!q\r\nAa12345!q\r\n"
+    assert decode_lines(data) == ["Aa12345!q", "Aa12345!q"]
+    report = audit_stream(io.BytesIO(data), workers=1, chunk_bytes=chunk_bytes)
+
+    assert report.total == 2
+    assert report.invalid == 2
+    assert report.failures["MinLengthRule"] == 2
+
+
+def test_cli(tmp_path, capsys):
+    path = tmp_path / "dump.txt"
+    path.write_text("short\nAa12345!qwery", encoding="utf-8")  # без перевода строки в конце
+    lines = tmp_path / "bad.tsv"
+
+    assert main([str(path), "--workers", "1", "--lines", str(lines)]) == 0
+    assert lines.read_text(encoding="utf-8") == "1\tMinLengthRule,HasSpecialCharRule,HasTitleRule,MinDigitsRule\n"
+    assert "невалидных: 1" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("newline, chunk_bytes", [(b"\n", 1_000), (b"\r\n", 1_000), (b"\r\n", 4)])
+def test_cli_with_breached_filter_in_workers(tmp_path, capsys, newline, chunk_bytes):
+    (tmp_path / "leaked.txt").write_text("Aa12345!qwery\n", encoding="utf-8")
+    build(tmp_path / "leaked.txt", tmp_path / "leaked.bloom").close()
+    path = tmp_path / "dump.txt"
+    path.write_bytes(newline.join([b"Aa12345!qwery", b"Bb67890!zxcvb", b"Aa12345!qwery", b""]))
+    lines = tmp_path / "bad.tsv"
+
+    assert main([str(path), "--workers", "2", "--breached", str(tmp_path / "leaked.bloom"),
+                 "--lines", str(lines), "--chunk-bytes", str(chunk_bytes)]) == 0
+    assert lines.read_text(encoding="utf-8") == "1\tNotBreachedRule\n3\tNotBreachedRule\n"
@@ -0,0 +1,53 @@
+import io
+
+import numpy as np
+import pytest
+
+from tasks_for_the_school.spiral import (
+    create_spiral,
+    create_spiral_loop,
+    iter_rows,
+    spiral_rows,
+    spiral_value,
+    write_spiral,
+)
+
+
+@pytest.mark.parametrize("n", range(0, 41))
+def test_matches_loop_version(n):
+    np.testing.assert_array_equal(create_spiral(n), create_spiral_loop(n))
+
+
+def test_memmap_output(tmp_path):
+    path = tmp_path / "spiral.npy"
+    create_spiral(37, path, dtype=np.int32)
+    loaded = np.load(path, mmap_mode="r")
+    assert loaded.dtype == np.int32
+    np.testing.assert_array_equal(loaded, create_spiral_loop(37))
+
+
+def test_rows_slice_and_dtype_limit():
+    np.testing.assert_array_equal(spiral_rows(9, 3, 7), create_spiral_loop(9)[3:7])
+    with pytest.raises(ValueError):
+        create_spiral(50_000, dtype=np.int32)
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 4, 7, 10])
+def test_value_and_rows_without_matrix(n):
+    expected = create_spiral_loop(n)
+    assert [[spiral_value(n, i, j) for j in range(n)] for i in range(n)] == expected.tolist()
+    assert [row.tolist() for row in iter_rows(n)] == expected.tolist()
+
+
+def test_value_for_huge_n_and_bounds():
+    n = 10**9
+    assert spiral_value(n, 0, n - 1) == n
+    assert spiral_value(n, 1, 0) == 4 * n - 4
+    with pytest.raises(IndexError):
+        spiral_value(3, 3, 0)
+
+
+def test_write_spiral_streams_text():
+    out = io.StringIO()
+    write_spiral(3, out)
+    assert out.getvalue() == "1 2 3\n8 9 4\n7 6 5\n"
@@ -0,0 +1,75 @@
+from array import array
+import io
+import random
+
+import pytest
+
+from task_1_maximum_palindrome import (
+    iter_sequences,
+    longest_palindrome,
+    longest_palindrome_compact,
+    main,
+    max_len,
+    max_len_bruteforce,
+    solve_stream,
+)
+
+
+@pytest.mark.parametrize("line, expected", [
+    ("1 2 3 4 3 2 1", 7),
+    ("1 2 3 4 5", 0),
+    ("1 2 3 4 5 5 4 3 2 1", 10),
+    ("1 2 3 1 2 3", 0),
+    ("112", 0),  # одно число, а не строка "112"
+    ("10 1 10", 3),
+    ("10 1", 0),  # раньше склеивалось в "101"
+    ("", 0),
+])
+def test_examples(line, expected):
+    assert max_len(line) == expected
+
+
+def test_matches_bruteforce_on_random_sequences():
+    rng = random.Random(1)
+    for _ in range(300):
+        seq = [rng.randint(1, 3) for _ in range(rng.randint(0, 40))]
+        assert max_len(seq) == max_len_bruteforce(seq)
+
+
+def test_position_and_sequence_types():
+    assert longest_palindrome([5, 1, 2, 2, 1, 7, 7]) == (1, 4)
+    assert longest_palindrome([1, 2, 3]) == (0, 1)  # самый левый из равных
+    assert longest_palindrome(array("q", [9, 8, 9])) == (0, 3)
+    assert longest_palindrome("abacaba") == (0, 7)
+
+
+def test_compact_matches_list_version():
+    rng = random.Random(2)
+    for _ in range(300):
+        seq = array("q", (rng.randint(1, 3) for _ in range(rng.randint(0, 40))))
+        expected = longest_palindrome(seq) if seq else (0, 0)
+        assert longest_palindrome_compact(seq) == expected
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 3, 7, 1 << 20])
+def test_iter_sequences_across_chunk_boundaries(chunk_bytes):
+    data = b"1 22 333 22 1\r\n\n10 1\n4444 5 4444   \n7"
+    sequences = [list(seq) for seq in iter_sequences(io.BytesIO(data), chunk_bytes)]
+    assert sequences == [[1, 22, 333, 22, 1], [], [10, 1], [4444, 5, 4444], [7]]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_solve_stream_keeps_line_order(workers):
+    rng = random.Random(3)
+    lines = [[rng.randint(1, 3) for _ in range(rng.randint(0, 200))] for _ in range(50)]
+    data = "".join(" ".join(map(str, line)) + "\n" for line in lines).encode()
+
+    answers = list(solve_stream(io.BytesIO(data), workers=workers, chunk_bytes=64))
+    assert [length for _, length in answers] == [max_len(line) for line in lines]
+
+
+def test_scan_cli(tmp_path, capsys):
+    path = tmp_path / "sequences.txt"
+    path.write_text("5 1 2 2 1\n1 2 3\n", encoding="utf-8")
+    assert main(["scan", str(path), "--workers", "1", "--positions"]) == 0
+    assert capsys.readouterr().out == "1 4\n0 0\n"
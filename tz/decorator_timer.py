@@ -11,41 +11,191 @@ f('1')
 """
 
 from functools import wraps
+import inspect
 import logging
 import time
 
+from tz.memory import start_measure, stop_measure
+from tz.metrics import MetricsRegistry, metric_name
+from tz.sampling import Sampler
+from tz.spans import Tracer
+
 logging.basicConfig(level=logging.INFO, format="[%(levelname)s], %(message)s")
 logger = logging.getLogger("my_loger")
 
 
-def timeit(log):
+def _format_params(args, kwargs):
+    return ", ".join(
+        [repr(arg) for arg in args]
+        + [f"{key}={repr(value)}" for key, value in kwargs.items()]
+    )
+
+
+def timeit(
+    log,
+    registry: MetricsRegistry = None,
+    sampling: Sampler = None,
+    tracer: Tracer = None,
+    memory: bool = False,
+):
+    """
+    registry — режим агрегации: вместо строки лога на каждый успешный вызов
+    время пишется в гистограмму функции в реестре, а в лог попадает
+    сводка при registry.flush(...) или по таймеру registry.start_autoflush(...).
+
+    sampling — политика сэмплирования успешных вызовов (см. tz.sampling);
+    вместе с registry выбранные вызовы пишутся в лог в дополнение к гистограмме.
+    Ошибки пишутся на уровне ERROR всегда, в том числе с registry. Строка
+    с аргументами собирается только для записей, которые реально уходят в лог.
+
+    Поддерживаются обычные функции, корутины (async def), генераторы
+    и async-генераторы: время меряется до конца await/итерации.
+
+    tracer — каждый вызов функции или корутины дополнительно пишется
+    как span в дерево вызовов (см. tz.spans). Генераторы не трассируются:
+    между yield контекст span-а утёк бы к потребителю.
+
+    memory — дополнительно меряет пиковую и остаточную (net) память вызова
+    через tracemalloc (см. tz.memory) и кладёт её рядом с временем:
+    в строку лога или в статистику функции в registry. Только для обычных
+    функций: у корутин и генераторов аллокации чужих задач смешались бы с их.
+    Первый такой вызов запускает tracemalloc для всего процесса, и он работает
+    (замедляя все аллокации) до tz.memory.disable() — см. tz.memory.tracing().
+    """
     def wrapper(func):
-        @wraps(func)
-        def inner(*args, **kwargs):
-            start = time.monotonic()
-            params_func = ", ".join(
-                [repr(arg) for arg in args]
-                + [f"{key}={repr(value)}" for key, value in kwargs.items()]
-            )
-            flag = True
-            try:
-                return func(*args, **kwargs)
-            except:
-                flag = False
-                raise
-            finally:
-                stop = time.monotonic()
-                delta = stop - start
-                level = logging.INFO if flag else logging.ERROR
-                # Чем проще объект, которым мы оперируем — тем легче с ним работать, меньше багов, выше переносимость.
-                # Даже если в лоб оба подхода дают тот же результат —
-                # log_level предпочтительнее как более универсальный и безопасный путь.
-                # По сравнению с log_method = log.info if flag else log.error
+        if memory and (
+            inspect.iscoroutinefunction(func)
+            or inspect.isasyncgenfunction(func)
+            or inspect.isgeneratorfunction(func)
+        ):
+            raise TypeError("timeit(memory=True) поддерживает только обычные функции")
+        if tracer is not None and not (
+            inspect.isgeneratorfunction(func) or inspect.isasyncgenfunction(func)
+        ):
+            func = tracer.trace(func)
+        sampler = sampling.clone() if sampling is not None else None
+
+        def report(delta, flag, args, kwargs, mem=None):
+            level = logging.INFO if flag else logging.ERROR
+            if flag and sampler is not None and not sampler.should_log():
+                return
+            if not log.isEnabledFor(level):
+                return
+            params_func = _format_params(args, kwargs)
+            # Чем проще объект, которым мы оперируем — тем легче с ним работать, меньше багов, выше переносимость.
+            # Даже если в лоб оба подхода дают тот же результат —
+            # log_level предпочтительнее как более универсальный и безопасный путь.
+            # По сравнению с log_method = log.info if flag else log.error
+            if mem is None:
                 log.log(level, "%s(%s) %.1f sec", func.__name__, params_func, delta)
-                # log.log(...) — универсальный способ логирования с переменным уровнем.
-                # Вместо вызова конкретного метода (info(), warning()) ты вызываешь один метод,
-                # передавая уровень как аргумент.
-                # Это делает код более гибким и масштабируемым, особенно в сложных системах или библиотеках.
+            else:
+                log.log(level, "%s(%s) %.1f sec, peak=%d B, net=%d B", func.__name__, params_func, delta, *mem)
+            # log.log(...) — универсальный способ логирования с переменным уровнем.
+            # Вместо вызова конкретного метода (info(), warning()) ты вызываешь один метод,
+            # передавая уровень как аргумент.
+            # Это делает код более гибким и масштабируемым, особенно в сложных системах или библиотеках.
+
+        if registry is not None:
+            stats = registry.stats(metric_name(func))
+
+            def finish(delta, flag, args, kwargs, mem=None):
+                stats.record(delta, flag, mem)
+                if not flag or sampler is not None:
+                    report(delta, flag, args, kwargs, mem)
+        else:
+            finish = report
+
+        # Для корутин и генераторов время считается до конца await/итерации,
+        # а не до момента создания объекта корутины/генератора.
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def inner(*args, **kwargs):
+                start = time.monotonic()
+                flag = True
+                try:
+                    return await func(*args, **kwargs)
+                except:
+                    flag = False
+                    raise
+                finally:
+                    finish(time.monotonic() - start, flag, args, kwargs)
+
+        elif inspect.isasyncgenfunction(func):
+            @wraps(func)
+            async def inner(*args, **kwargs):
+                start = time.monotonic()
+                flag = True
+                agen = func(*args, **kwargs)
+                try:
+                    # Ручная делегация: async-генераторы не поддерживают yield from,
+                    # а asend/athrow должны доходить до исходного генератора.
+                    send, value = agen.asend, None
+                    while True:
+                        try:
+                            item = await send(value)
+                        except StopAsyncIteration:
+                            break
+                        try:
+                            value = yield item
+                            send = agen.asend
+                        except GeneratorExit:
+                            await agen.aclose()
+                            raise
+                        except BaseException as exc:
+                            send, value = agen.athrow, exc
+                except GeneratorExit:
+                    # Досрочное закрытие потребителем — не ошибка
+                    raise
+                except:
+                    flag = False
+                    raise
+                finally:
+                    finish(time.monotonic() - start, flag, args, kwargs)
+
+        elif inspect.isgeneratorfunction(func):
+            @wraps(func)
+            def inner(*args, **kwargs):
+                start = time.monotonic()
+                flag = True
+                try:
+                    return (yield from func(*args, **kwargs))
+                except GeneratorExit:
+                    raise
+                except:
+                    flag = False
+                    raise
+                finally:
+                    finish(time.monotonic() - start, flag, args, kwargs)
+
+        elif memory:
+            @wraps(func)
+            def inner(*args, **kwargs):
+                frame = start_measure()
+                start = time.monotonic()
+                flag = True
+                try:
+                    return func(*args, **kwargs)
+                except:
+                    flag = False
+                    raise
+                finally:
+                    delta = time.monotonic() - start
+                    finish(delta, flag, args, kwargs, stop_measure(frame))
+
+        else:
+            @wraps(func)
+            def inner(*args, **kwargs):
+                start = time.monotonic()
+                flag = True
+                try:
+                    return func(*args, **kwargs)
+                except:
+                    flag = False
+                    raise
+                finally:
+                    stop = time.monotonic()
+                    delta = stop - start
+                    finish(delta, flag, args, kwargs)
 
         return inner
 
@@ -0,0 +1,125 @@
+"""
+Замер памяти на вызов для timeit(memory=True) через tracemalloc.
+
+На каждый вызов считаются:
+- peak — максимум выделенной памяти во время вызова относительно его начала;
+- net — сколько памяти осталось занято после вызова (рост = возможная утечка).
+
+tracemalloc.reset_peak() глобален, поэтому вложенные замеры ведутся стеком
+(свой на каждый поток): перед сбросом пик внешнего вызова сохраняется,
+а пик вложенного вызова поднимается наверх при его завершении.
+tracemalloc считает аллокации всего процесса, так что при параллельной
+работе нескольких потоков цифры функции включают чужие аллокации.
+
+Трассировка глобальна и замедляет каждую аллокацию в процессе, а не только
+в декорированных функциях. Первый замер запускает её сам и дальше не
+останавливает; чтобы ограничить накладные расходы участком кода:
+
+    enable()
+    ...  # вызовы функций с timeit(memory=True)
+    disable()
+
+или `with tracing(): ...`. disable() останавливает tracemalloc, только если
+его запустил этот модуль.
+"""
+
+from contextlib import contextmanager
+import threading
+import tracemalloc
+
+_local = threading.local()
+# tracemalloc запущен нами (enable или первым замером), а не внешним кодом
+_started = False
+
+
+def enable():
+    """Запускает tracemalloc, если он ещё не запущен"""
+    global _started
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started = True
+
+
+def disable():
+    """Останавливает tracemalloc, если его запустил этот модуль"""
+    global _started
+    if _started:
+        tracemalloc.stop()
+        _started = False
+
+
+@contextmanager
+def tracing():
+    enable()
+    try:
+        yield
+    finally:
+        disable()
+
+
+def _stack() -> list:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def start_measure() -> list:
+    """Начинает замер; если tracemalloc ещё не запущен — запускает его до disable()"""
+    enable()
+    stack = _stack()
+    current, peak = tracemalloc.get_traced_memory()
+    if stack:
+        stack[-1][1] = max(stack[-1][1], peak)
+    tracemalloc.reset_peak()
+    frame = [current, current]  # [память в начале, максимум, замеченный до сбросов]
+    stack.append(frame)
+    return frame
+
+
+def stop_measure(frame: list) -> tuple[int, int]:
+    """Заканчивает замер, возвращает (peak, net) в байтах"""
+    current, peak = tracemalloc.get_traced_memory()
+    stack = _stack()
+    stack.pop()
+    peak = max(peak, frame[1])
+    if stack:
+        stack[-1][1] = max(stack[-1][1], peak)
+    return peak - frame[0], current - frame[0]
+
+
+class MemoryStats:
+    """Агрегированная статистика памяти одной функции"""
+
+    __slots__ = ("count", "peak_sum", "peak_max", "net_sum", "net_max", "_lock")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.peak_sum = 0
+        self.peak_max = 0
+        self.net_sum = 0
+        self.net_max = 0
+
+    def record(self, peak: int, net: int):
+        with self._lock:
+            self.count += 1
+            self.peak_sum += peak
+            self.net_sum += net
+            if peak > self.peak_max:
+                self.peak_max = peak
+            if net > self.net_max:
+                self.net_max = net
+
+    def summary(self) -> dict:
+        if not self.count:
+            return {}
+        return {
+            "peak_mean": self.peak_sum / self.count,
+            "peak_max": self.peak_max,
+            "net_sum": self.net_sum,
+            "net_max": self.net_max,
+        }
@@ -0,0 +1,213 @@
+"""
+Внутрипроцессный реестр метрик для декоратора timeit.
+
+Вместо строки лога на каждый вызов timeit копит статистику по функции:
+count, sum, min/max и гистограмму задержек с фиксированными корзинами
+(лог-линейная сетка в духе HDR: 8 корзин на каждую степень двойки,
+относительная погрешность перцентилей ~9%).
+Сброс в лог — по запросу (flush) или периодически (start_autoflush).
+"""
+
+from bisect import bisect_left
+import logging
+import threading
+
+from tz.memory import MemoryStats
+
+# Границы корзин в секундах: от 1 мкс до ~268 сек (1e-6 * 2**28).
+# Считаются один раз при импорте, запись в гистограмму — bisect + инкремент.
+_SUB_BUCKETS = 8
+_MIN_VALUE = 1e-6
+_POWERS = 28
+
+BUCKET_BOUNDS = [
+    _MIN_VALUE * 2 ** (power + sub / _SUB_BUCKETS)
+    for power in range(_POWERS)
+    for sub in range(1, _SUB_BUCKETS + 1)
+]
+
+
+def metric_name(func) -> str:
+    """Имя статистики функции: модуль + qualname, чтобы одноимённые функции разных модулей не сливались"""
+    return f"{func.__module__}.{func.__qualname__}"
+
+
+class LatencyHistogram:
+    """Гистограмма задержек с фиксированными корзинами"""
+
+    __slots__ = ("counts", "count", "total", "min", "max", "_lock")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        # Последняя корзина — переполнение (всё, что больше BUCKET_BOUNDS[-1])
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def record(self, value: float):
+        with self._lock:
+            self._add(value)
+
+    def _add(self, value: float):
+        # Без блокировки — для тех, кто держит свою (FunctionStats)
+        self.counts[bisect_left(BUCKET_BOUNDS, value)] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> float:
+        """
+        Возвращает верхнюю границу корзины, в которую попадает q-й перцентиль (0..100).
+        Результат не выходит за пределы наблюдавшихся min/max.
+        """
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if bucket_count and seen >= rank:
+                bound = BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else self.max
+                return min(max(bound, self.min), self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.total / self.count,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+class FunctionStats:
+    """
+    Статистика одной функции: задержки, количество ошибок и (для memory=True) память.
+    Всё пишется под одной блокировкой, чтобы сводка и сброс были согласованы.
+    """
+
+    __slots__ = ("name", "latency", "errors", "memory", "_lock")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.latency = LatencyHistogram()
+        self.errors = 0
+        self.memory = MemoryStats()
+        self._lock = threading.Lock()
+
+    def record(self, delta: float, ok: bool, mem: tuple[int, int] = None):
+        with self._lock:
+            self.latency._add(delta)
+            if not ok:
+                self.errors += 1
+            if mem is not None:
+                self.memory.record(*mem)
+
+    def _reset(self):
+        self.latency.reset()
+        self.errors = 0
+        self.memory.reset()
+
+    def _summary(self) -> dict:
+        result = self.latency.summary()
+        result["errors"] = self.errors
+        result.update(self.memory.summary())
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._reset()
+
+    def summary(self, reset: bool = False) -> dict:
+        """Сводка; с reset=True статистика обнуляется в том же захвате блокировки"""
+        with self._lock:
+            result = self._summary()
+            if reset:
+                self._reset()
+        return result
+
+
+class MetricsRegistry:
+    """
+    Реестр статистик по именам функций.
+    timeit получает FunctionStats один раз при декорировании,
+    поэтому на горячем пути нет поиска по словарю.
+    """
+
+    def __init__(self):
+        self._stats: dict[str, FunctionStats] = {}
+        self._lock = threading.Lock()
+        self._stop_event = None
+        self._thread = None
+
+    def stats(self, name: str) -> FunctionStats:
+        with self._lock:
+            if name not in self._stats:
+                self._stats[name] = FunctionStats(name)
+            return self._stats[name]
+
+    def snapshot(self) -> dict[str, dict]:
+        with self._lock:
+            items = list(self._stats.items())
+        return {name: stats.summary() for name, stats in items}
+
+    def flush(self, log: logging.Logger, reset: bool = True) -> dict[str, dict]:
+        """Пишет по строке на функцию в лог и (по умолчанию) обнуляет статистику"""
+        with self._lock:
+            items = list(self._stats.items())
+        result = {}
+        for name, stats in items:
+            summary = stats.summary(reset=reset)
+            if not summary["count"]:
+                continue
+            result[name] = summary
+            log.info(
+                "%s: count=%d errors=%d sum=%.6f min=%.6f max=%.6f p50=%.6f p95=%.6f p99=%.6f sec",
+                name, summary["count"], summary["errors"], summary["sum"],
+                summary["min"], summary["max"],
+                summary["p50"], summary["p95"], summary["p99"],
+            )
+            if "peak_max" in summary:
+                log.info(
+                    "%s: peak_mean=%.0f peak_max=%d net_sum=%d net_max=%d B",
+                    name, summary["peak_mean"], summary["peak_max"],
+                    summary["net_sum"], summary["net_max"],
+                )
+        return result
+
+    def start_autoflush(self, log: logging.Logger, interval: float = 60.0):
+        """Запускает фоновый поток, который вызывает flush раз в interval секунд"""
+        if self._thread is not None:
+            return
+        self._stop_event = threading.Event()
+
+        def run():
+            while not self._stop_event.wait(interval):
+                self.flush(log)
+
+        self._thread = threading.Thread(target=run, name="metrics-autoflush", daemon=True)
+        self._thread.start()
+
+    def stop_autoflush(self, log: logging.Logger = None):
+        """Останавливает фоновый поток; если передан log — делает финальный flush"""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        if log is not None:
+            self.flush(log)
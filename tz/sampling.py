@@ -0,0 +1,87 @@
+"""
+Политики сэмплирования для декоратора timeit.
+
+Сэмплер решает, писать ли в лог запись об успешном вызове.
+Ошибки timeit логирует всегда, сэмплер для них не спрашивается.
+Каждая задекорированная функция получает свою копию сэмплера (clone),
+поэтому счётчики и лимиты считаются отдельно по функциям.
+"""
+
+from abc import ABC, abstractmethod
+import random
+import threading
+import time
+
+
+class Sampler(ABC):
+    """Абстрактный базовый класс для политик сэмплирования"""
+
+    @abstractmethod
+    def should_log(self) -> bool:
+        pass
+
+    @abstractmethod
+    def clone(self) -> "Sampler":
+        """Новый экземпляр с теми же настройками и чистым состоянием"""
+        pass
+
+
+class EveryNthSampler(Sampler):
+    """Пишет каждый n-й вызов (1-й, n+1-й, ...)"""
+
+    def __init__(self, n: int):
+        if n < 1:
+            raise ValueError("n должно быть >= 1")
+        self.n = n
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    def should_log(self) -> bool:
+        with self._lock:
+            emit = self._counter == 0
+            self._counter = (self._counter + 1) % self.n
+        return emit
+
+    def clone(self):
+        return EveryNthSampler(self.n)
+
+
+class ProbabilisticSampler(Sampler):
+    """Пишет вызов с вероятностью probability"""
+
+    def __init__(self, probability: float):
+        if not 0 <= probability <= 1:
+            raise ValueError("probability должна быть в диапазоне [0, 1]")
+        self.probability = probability
+        self._random = random.random
+
+    def should_log(self) -> bool:
+        return self._random() < self.probability
+
+    def clone(self):
+        return ProbabilisticSampler(self.probability)
+
+
+class RateLimitSampler(Sampler):
+    """Не больше per_second записей в секунду (token bucket)"""
+
+    def __init__(self, per_second: float):
+        if per_second <= 0:
+            raise ValueError("per_second должно быть > 0")
+        self.per_second = per_second
+        self._tokens = per_second
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def should_log(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            self._tokens = min(self.per_second, self._tokens + (now - self._last) * self.per_second)
+            self._last = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def clone(self):
+        return RateLimitSampler(self.per_second)
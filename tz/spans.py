@@ -0,0 +1,168 @@
+"""
+Иерархическая трассировка (span-ы) поверх timeit.
+
+Текущий span хранится в contextvars, поэтому связь родитель/потомок
+сохраняется и внутри asyncio-задач (задача копирует контекст при создании).
+Завершённые span-ы складываются в кольцевой буфер фиксированного размера,
+из которого можно собрать дерево вызовов одного запроса (trace)
+с total-time и self-time каждого узла.
+"""
+
+from collections import deque
+from contextvars import ContextVar
+from functools import wraps
+import inspect
+import itertools
+import time
+
+_current_span: ContextVar["Span"] = ContextVar("current_span", default=None)
+
+
+class Span:
+    """Один замер: контекстный менеджер, который создаёт Tracer.span(...)"""
+
+    __slots__ = (
+        "tracer", "name", "span_id", "parent", "trace_id",
+        "start", "end", "child_time", "error", "_token",
+    )
+
+    def __init__(self, tracer: "Tracer", name: str):
+        self.tracer = tracer
+        self.name = name
+        self.span_id = None
+        self.parent = None
+        self.trace_id = None
+        self.start = None
+        self.end = None
+        self.child_time = 0.0
+        self.error = False
+        self._token = None
+
+    @property
+    def parent_id(self):
+        return self.parent.span_id if self.parent is not None else None
+
+    @property
+    def total(self) -> float:
+        return self.end - self.start
+
+    @property
+    def self_time(self) -> float:
+        # Дочерние asyncio-задачи могут идти параллельно, и их сумма
+        # бывает больше времени родителя — тогда self-time считаем нулевым.
+        return max(0.0, self.total - self.child_time)
+
+    def __enter__(self):
+        self.parent = _current_span.get()
+        self.span_id = next(self.tracer._ids)
+        self.trace_id = self.parent.trace_id if self.parent is not None else self.span_id
+        self._token = _current_span.set(self)
+        self.start = time.monotonic()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end = time.monotonic()
+        _current_span.reset(self._token)
+        self._token = None
+        self.error = exc_type is not None
+        if self.parent is not None:
+            self.parent.child_time += self.total
+        self.tracer._finished.append(self)
+        return False
+
+
+class Tracer:
+    """
+    Хранит последние capacity завершённых span-ов.
+    Старые span-ы вытесняются новыми, память не растёт.
+    """
+
+    def __init__(self, capacity: int = 10_000):
+        self._finished: deque[Span] = deque(maxlen=capacity)
+        self._ids = itertools.count(1)
+
+    def span(self, name: str) -> Span:
+        return Span(self, name)
+
+    def trace(self, func=None, *, name: str = None):
+        """
+        Декоратор: оборачивает каждый вызов функции (в том числе async) в span.
+        Генераторы не поддерживаются: span закрылся бы при создании генератора,
+        а между yield его контекст утёк бы к потребителю.
+        """
+        def wrapper(func):
+            if inspect.isgeneratorfunction(func) or inspect.isasyncgenfunction(func):
+                raise TypeError("Tracer.trace не поддерживает генераторы")
+            span_name = name or func.__qualname__
+
+            if inspect.iscoroutinefunction(func):
+                @wraps(func)
+                async def inner(*args, **kwargs):
+                    with self.span(span_name):
+                        return await func(*args, **kwargs)
+            else:
+                @wraps(func)
+                def inner(*args, **kwargs):
+                    with self.span(span_name):
+                        return func(*args, **kwargs)
+
+            return inner
+
+        if func is not None:
+            return wrapper(func)
+        return wrapper
+
+    def spans(self, trace_id: int = None) -> list[Span]:
+        spans = list(self._finished)
+        if trace_id is None:
+            return spans
+        return [span for span in spans if span.trace_id == trace_id]
+
+    def trace_ids(self) -> list[int]:
+        return list(dict.fromkeys(span.trace_id for span in self._finished))
+
+    def clear(self):
+        self._finished.clear()
+
+    def tree(self, trace_id: int) -> list[dict]:
+        """
+        Дерево вызовов одного trace: список корней, у каждого узла
+        name, total, self, error и children (в порядке начала).
+        Если родитель уже вытеснен из буфера, потомок становится корнем.
+        """
+        spans = sorted(self.spans(trace_id), key=lambda span: span.start)
+        nodes = {
+            span.span_id: {
+                "name": span.name,
+                "total": span.total,
+                "self": span.self_time,
+                "error": span.error,
+                "children": [],
+            }
+            for span in spans
+        }
+        roots = []
+        for span in spans:
+            parent_node = nodes.get(span.parent_id)
+            if parent_node is None:
+                roots.append(nodes[span.span_id])
+            else:
+                parent_node["children"].append(nodes[span.span_id])
+        return roots
+
+    def format_tree(self, trace_id: int) -> str:
+        lines = []
+
+        def walk(node, depth):
+            lines.append(
+                "{}{} total={:.6f} self={:.6f} sec{}".format(
+                    "  " * depth, node["name"], node["total"], node["self"],
+                    " [ERROR]" if node["error"] else "",
+                )
+            )
+            for child in node["children"]:
+                walk(child, depth + 1)
+
+        for root in self.tree(trace_id):
+            walk(root, 0)
+        return "\n".join(lines)
@@ -0,0 +1,86 @@
+import asyncio
+import inspect
+import logging
+
+import pytest
+
+from tz.decorator_timer import timeit
+from tz.metrics import MetricsRegistry, metric_name
+
+log = logging.getLogger("test_async_timeit")
+
+
+def test_coroutine_is_timed_until_awaited():
+    registry = MetricsRegistry()
+
+    @timeit(log, registry=registry)
+    async def f(s):
+        await asyncio.sleep(s)
+        return 5
+
+    assert inspect.iscoroutinefunction(f)
+    assert asyncio.run(f(0.05)) == 5
+    summary = registry.snapshot()[metric_name(f)]
+    assert summary["count"] == 1
+    assert summary["min"] >= 0.05
+
+
+def test_coroutine_error_is_logged(caplog):
+    @timeit(log)
+    async def f(x):
+        await asyncio.sleep(0)
+        return 1 / x
+
+    with caplog.at_level(logging.INFO, logger="test_async_timeit"):
+        with pytest.raises(ZeroDivisionError):
+            asyncio.run(f(0))
+    assert [record.levelno for record in caplog.records] == [logging.ERROR]
+
+
+def test_generator_is_timed_over_iteration():
+    registry = MetricsRegistry()
+
+    @timeit(log, registry=registry)
+    def gen(n):
+        for i in range(n):
+            received = yield i
+            if received is not None:
+                yield received
+
+    g = gen(3)
+    assert registry.snapshot() == {metric_name(gen): {"count": 0, "errors": 0}}
+    assert next(g) == 0
+    assert g.send("x") == "x"
+    assert list(g) == [1, 2]
+    assert registry.snapshot()[metric_name(gen)]["count"] == 1
+
+
+def test_async_generator_is_timed_over_iteration(caplog):
+    @timeit(log)
+    async def agen(n):
+        for i in range(n):
+            await asyncio.sleep(0)
+            yield i
+
+    async def main():
+        return [i async for i in agen(3)]
+
+    with caplog.at_level(logging.INFO, logger="test_async_timeit"):
+        assert asyncio.run(main()) == [0, 1, 2]
+    assert [record.levelno for record in caplog.records] == [logging.INFO]
+
+
+def test_closed_async_generator_is_not_an_error(caplog):
+    @timeit(log)
+    async def agen():
+        while True:
+            yield 1
+
+    async def main():
+        g = agen()
+        await g.__anext__()
+        await g.aclose()
+
+    with caplog.at_level(logging.INFO, logger="test_async_timeit"):
+        asyncio.run(main())
+    assert [record.levelno for record in caplog.records] == [logging.INFO]
@@ -0,0 +1,97 @@
+import logging
+import tracemalloc
+
+import pytest
+
+from tz import memory
+from tz.decorator_timer import timeit
+from tz.metrics import MetricsRegistry, metric_name
+
+log = logging.getLogger("test_memory")
+
+
+@pytest.fixture(autouse=True)
+def stop_tracemalloc():
+    yield
+    memory.disable()
+
+
+def test_peak_and_net_memory_per_call():
+    registry = MetricsRegistry()
+    kept = []
+
+    @timeit(log, registry=registry, memory=True)
+    def temporary():
+        return len(bytearray(1_000_000))
+
+    @timeit(log, registry=registry, memory=True)
+    def leaking():
+        kept.append(bytearray(500_000))
+
+    temporary()
+    leaking()
+    snapshot = registry.snapshot()
+
+    assert snapshot[metric_name(temporary)]["peak_max"] >= 1_000_000
+    assert snapshot[metric_name(temporary)]["net_max"] < 100_000
+    assert snapshot[metric_name(leaking)]["net_sum"] >= 500_000
+
+
+def test_nested_call_keeps_outer_peak():
+    registry = MetricsRegistry()
+
+    @timeit(log, registry=registry, memory=True)
+    def inner():
+        return 1
+
+    @timeit(log, registry=registry, memory=True)
+    def outer():
+        data = bytearray(1_000_000)
+        del data
+        return inner()
+
+    outer()
+    assert registry.snapshot()[metric_name(outer)]["peak_max"] >= 1_000_000
+
+
+def test_memory_is_logged(caplog):
+    @timeit(log, memory=True)
+    def f():
+        return 1
+
+    with caplog.at_level(logging.INFO, logger="test_memory"):
+        f()
+    assert "peak=" in caplog.records[0].getMessage()
+
+
+def test_memory_rejects_coroutines():
+    with pytest.raises(TypeError):
+        @timeit(log, memory=True)
+        async def f():
+            pass
+
+
+def test_tracing_stops_tracemalloc_started_by_measure():
+    @timeit(log, memory=True)
+    def f():
+        return 1
+
+    with memory.tracing():
+        f()
+        assert tracemalloc.is_tracing()
+    assert not tracemalloc.is_tracing()
+
+    f()
+    assert tracemalloc.is_tracing()
+    memory.disable()
+    assert not tracemalloc.is_tracing()
+
+
+def test_disable_keeps_external_tracemalloc():
+    tracemalloc.start()
+    try:
+        with memory.tracing():
+            pass
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
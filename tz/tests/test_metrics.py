@@ -0,0 +1,118 @@
+import logging
+import threading
+import types
+
+import pytest
+
+from tz.decorator_timer import timeit
+from tz.metrics import LatencyHistogram, MetricsRegistry, metric_name
+from tz.sampling import EveryNthSampler
+
+
+def test_histogram_percentiles():
+    hist = LatencyHistogram()
+    for i in range(1, 101):
+        hist.record(i / 1000)
+    summary = hist.summary()
+    assert summary["count"] == 100
+    assert summary["min"] == pytest.approx(0.001)
+    assert summary["max"] == pytest.approx(0.1)
+    # Погрешность корзин — не больше ~9%
+    assert summary["p50"] == pytest.approx(0.05, rel=0.1)
+    assert summary["p99"] == pytest.approx(0.099, rel=0.1)
+
+
+def test_timeit_feeds_registry_and_logs_only_errors(caplog):
+    registry = MetricsRegistry()
+    log = logging.getLogger("test_metrics")
+
+    @timeit(log, registry=registry)
+    def f(x):
+        return 1 / x
+
+    with caplog.at_level(logging.INFO, logger="test_metrics"):
+        for _ in range(10):
+            f(1)
+        assert not caplog.records
+        with pytest.raises(ZeroDivisionError):
+            f(0)
+        assert [record.levelno for record in caplog.records] == [logging.ERROR]
+        caplog.clear()
+
+        flushed = registry.flush(log)
+
+    name = metric_name(f)
+    assert flushed[name]["count"] == 11
+    assert flushed[name]["errors"] == 1
+    assert len(caplog.records) == 1
+    assert registry.snapshot()[name] == {"count": 0, "errors": 0}
+
+
+def test_timeit_registry_honours_sampler(caplog):
+    registry = MetricsRegistry()
+    log = logging.getLogger("test_metrics.sampled")
+
+    @timeit(log, registry=registry, sampling=EveryNthSampler(5))
+    def f(x):
+        return 1 / x
+
+    with caplog.at_level(logging.INFO, logger="test_metrics.sampled"):
+        for _ in range(10):
+            f(1)
+        with pytest.raises(ZeroDivisionError):
+            f(0)
+
+    levels = [record.levelno for record in caplog.records]
+    assert levels == [logging.INFO, logging.INFO, logging.ERROR]
+    assert registry.snapshot()[metric_name(f)]["count"] == 11
+
+
+def test_flush_does_not_lose_concurrent_records():
+    registry = MetricsRegistry()
+    stats = registry.stats("f")
+    log = logging.getLogger("test_metrics.flush")
+    per_thread, threads = 20_000, 4
+    done = threading.Event()
+    flushed = {"count": 0, "errors": 0}
+
+    def work():
+        for i in range(per_thread):
+            stats.record(0.001, i % 2 == 0)
+
+    def flusher():
+        while not done.is_set():
+            for summary in registry.flush(log).values():
+                flushed["count"] += summary["count"]
+                flushed["errors"] += summary["errors"]
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    background = threading.Thread(target=flusher)
+    background.start()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    done.set()
+    background.join()
+    for summary in registry.flush(log).values():
+        flushed["count"] += summary["count"]
+        flushed["errors"] += summary["errors"]
+
+    assert flushed == {"count": per_thread * threads, "errors": per_thread * threads // 2}
+
+
+def test_same_qualname_in_different_modules_is_not_merged():
+    registry = MetricsRegistry()
+    log = logging.getLogger("test_metrics.modules")
+
+    def handler():
+        return 1
+
+    other = types.FunctionType(handler.__code__, {"__name__": "other_module"}, "handler")
+    other.__qualname__ = handler.__qualname__
+    timeit(log, registry=registry)(handler)()
+    timeit(log, registry=registry)(other)()
+
+    snapshot = registry.snapshot()
+    assert len(snapshot) == 2
+    assert snapshot[f"other_module.{handler.__qualname__}"]["count"] == 1
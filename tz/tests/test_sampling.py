@@ -0,0 +1,69 @@
+import logging
+import threading
+
+import pytest
+
+from tz.decorator_timer import timeit
+from tz.sampling import EveryNthSampler, ProbabilisticSampler, RateLimitSampler
+
+
+class LoudRepr:
+    """Считает, сколько раз у объекта вызывали repr"""
+
+    calls = 0
+
+    def __repr__(self):
+        LoudRepr.calls += 1
+        return "LoudRepr()"
+
+
+def test_every_nth_sampler_logs_one_in_n(caplog):
+    log = logging.getLogger("test_sampling")
+
+    @timeit(log, sampling=EveryNthSampler(5))
+    def f(x):
+        return x
+
+    LoudRepr.calls = 0
+    with caplog.at_level(logging.INFO, logger="test_sampling"):
+        for _ in range(10):
+            assert isinstance(f(LoudRepr()), LoudRepr)
+    assert len(caplog.records) == 2
+    # repr собирается только для реально записанных строк
+    assert LoudRepr.calls == 2
+
+
+def test_errors_are_always_logged(caplog):
+    log = logging.getLogger("test_sampling")
+
+    @timeit(log, sampling=ProbabilisticSampler(0))
+    def f(x):
+        return 1 / x
+
+    with caplog.at_level(logging.INFO, logger="test_sampling"):
+        f(1)
+        with pytest.raises(ZeroDivisionError):
+            f(0)
+    assert [record.levelno for record in caplog.records] == [logging.ERROR]
+
+
+def test_rate_limit_sampler():
+    sampler = RateLimitSampler(3)
+    assert sum(sampler.should_log() for _ in range(100)) == 3
+    assert sampler.clone().should_log()
+
+
+
+def test_every_nth_sampler_is_exact_across_threads():
+    sampler = EveryNthSampler(10)
+    logged = []
+
+    def work():
+        logged.append(sum(sampler.should_log() for _ in range(20_000)))
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sum(logged) == 8 * 20_000 // 10
@@ -0,0 +1,88 @@
+import asyncio
+import logging
+import time
+
+import pytest
+
+from tz.decorator_timer import timeit
+from tz.metrics import MetricsRegistry
+from tz.spans import Tracer
+
+
+def test_nested_spans_build_call_tree():
+    tracer = Tracer()
+
+    with tracer.span("request") as root:
+        with tracer.span("db"):
+            time.sleep(0.02)
+        with tracer.span("render"):
+            pass
+
+    tree = tracer.tree(root.trace_id)
+    assert len(tree) == 1
+    node = tree[0]
+    assert node["name"] == "request"
+    assert [child["name"] for child in node["children"]] == ["db", "render"]
+    assert node["total"] >= node["children"][0]["total"] >= 0.02
+    assert node["self"] < node["children"][0]["total"]
+    assert "  db total=" in tracer.format_tree(root.trace_id)
+
+
+def test_spans_follow_asyncio_tasks():
+    tracer = Tracer()
+
+    @tracer.trace
+    async def child(i):
+        await asyncio.sleep(0.01)
+        return i
+
+    @tracer.trace(name="handler")
+    async def handler():
+        return await asyncio.gather(*(child(i) for i in range(3)))
+
+    assert asyncio.run(handler()) == [0, 1, 2]
+    (trace_id,) = tracer.trace_ids()
+    (root,) = tracer.tree(trace_id)
+    assert root["name"] == "handler"
+    assert len(root["children"]) == 3
+
+
+def test_ring_buffer_is_bounded():
+    tracer = Tracer(capacity=5)
+    for _ in range(20):
+        with tracer.span("x"):
+            pass
+    assert len(tracer.spans()) == 5
+
+
+def test_timeit_records_spans():
+    tracer = Tracer()
+    registry = MetricsRegistry()
+    log = logging.getLogger("test_spans")
+
+    @timeit(log, registry=registry, tracer=tracer)
+    def leaf():
+        return 1
+
+    @timeit(log, registry=registry, tracer=tracer)
+    def parent():
+        return leaf() + leaf()
+
+    assert parent() == 2
+    (trace_id,) = tracer.trace_ids()
+    (root,) = tracer.tree(trace_id)
+    assert root["name"] == parent.__qualname__
+    assert [child["name"] for child in root["children"]] == [leaf.__qualname__] * 2
+
+
+def test_trace_rejects_generators():
+    tracer = Tracer()
+    with pytest.raises(TypeError):
+        @tracer.trace
+        def numbers():
+            yield 1
+
+    with pytest.raises(TypeError):
+        @tracer.trace
+        async def stream():
+            yield 1
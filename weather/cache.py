@@ -0,0 +1,121 @@
+"""
+Дисковый кэш ответов OpenWeatherMap с TTL.
+
+Прогноз обновляется раз в несколько часов, поэтому ответ по ключу
+(город, единицы) хранится в SQLite вместе с временем загрузки и заголовками
+ETag/Last-Modified. Пока запись свежее ttl — сеть не нужна вовсе.
+Устаревшую запись можно перепроверить условным запросом
+(If-None-Match/If-Modified-Since): на 304 тело берётся из кэша.
+"""
+
+from dataclasses import dataclass
+import json
+import sqlite3
+import threading
+import time
+
+DEFAULT_TTL = 3 * 60 * 60
+
+
+@dataclass
+class CacheEntry:
+    data: dict
+    fetched_at: float
+    etag: str = None
+    last_modified: str = None
+
+    def is_fresh(self, ttl: float, now: float = None) -> bool:
+        return (now or time.time()) - self.fetched_at < ttl
+
+    def validators(self) -> dict:
+        """Заголовки для условного запроса"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ForecastCache:
+    """
+    Кэш в одном файле SQLite. Одно соединение на все потоки под замком:
+    запросы к кэшу на порядки быстрее сетевых, узким местом он не станет.
+    """
+
+    def __init__(self, path: str = "weather_cache.sqlite", ttl: float = DEFAULT_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS forecasts (
+                city TEXT NOT NULL,
+                units TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                body TEXT NOT NULL,
+                PRIMARY KEY (city, units)
+            )
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _key(city: str, units: str) -> tuple[str, str]:
+        return city.strip().casefold(), units
+
+    def get(self, city: str, units: str = "metric") -> CacheEntry:
+        """Запись независимо от свежести (или None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at, etag, last_modified, body FROM forecasts WHERE city = ? AND units = ?",
+                self._key(city, units),
+            ).fetchone()
+        if row is None:
+            return None
+        fetched_at, etag, last_modified, body = row
+        return CacheEntry(json.loads(body), fetched_at, etag, last_modified)
+
+    def get_fresh(self, city: str, units: str = "metric") -> CacheEntry:
+        entry = self.get(city, units)
+        if entry is not None and entry.is_fresh(self.ttl):
+            return entry
+        return None
+
+    def put(self, city: str, units: str, data: dict, etag: str = None, last_modified: str = None):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO forecasts VALUES (?, ?, ?, ?, ?, ?)",
+                (*self._key(city, units), time.time(), etag, last_modified, json.dumps(data, ensure_ascii=False)),
+            )
+            self._conn.commit()
+
+    def touch(self, city: str, units: str = "metric"):
+        """Продлевает запись после ответа 304 Not Modified"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE forecasts SET fetched_at = ? WHERE city = ? AND units = ?",
+                (time.time(), *self._key(city, units)),
+            )
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM forecasts WHERE fetched_at < ?", (time.time() - self.ttl,))
+            self._conn.commit()
+        return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
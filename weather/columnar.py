@@ -0,0 +1,112 @@
+"""
+Колоночный разбор прогнозов сразу в NumPy/pandas.
+
+Старый разбор строит словарь на каждую запись прогноза, затем pd.DataFrame
+перекладывает их в колонки, а pd.to_datetime парсит строки dt_txt.
+Здесь записи пишутся одним присваиванием строки в заранее выделенный
+структурированный массив (float32 для температур и давления, int64 секунды
+из dt, коды категорий для weather и города), а DataFrame собирается из
+представлений его полей — без копирования данных.
+
+Один ForecastColumns может накапливать прогнозы тысяч городов подряд.
+"""
+
+import numpy as np
+import pandas as pd
+
+FORECAST_DTYPE = np.dtype([
+    ("dt", "i8"),
+    ("temp", "f4"),
+    ("feels_like", "f4"),
+    ("temp_min", "f4"),
+    ("temp_max", "f4"),
+    ("humidity", "i2"),
+    ("pressure", "f4"),
+    ("wind_speed", "f4"),
+    ("wind_deg", "i2"),
+    ("weather", "i2"),
+    ("clouds", "i2"),
+    ("city", "i4"),
+])
+
+NUMERIC_COLUMNS = ("temp", "feels_like", "temp_min", "temp_max", "humidity", "pressure", "wind_speed", "wind_deg", "clouds")
+
+
+class ForecastColumns:
+    """
+    Накопитель записей прогноза в колоночном виде.
+    DataFrame из to_frame() разделяет память с накопителем:
+    изменения в нём видны в накопителе и наоборот.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self._rows = np.empty(capacity, FORECAST_DTYPE)
+        self._size = 0
+        self._weather_codes: dict[str, int] = {}
+        self._city_codes: dict[str, int] = {}
+
+    def __len__(self):
+        return self._size
+
+    def _reserve(self, extra: int):
+        needed = self._size + extra
+        if needed <= len(self._rows):
+            return
+        rows = np.empty(max(needed, 2 * len(self._rows)), FORECAST_DTYPE)
+        rows[:self._size] = self._rows[:self._size]
+        self._rows = rows
+
+    @staticmethod
+    def _code(codes: dict[str, int], value: str) -> int:
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+        return code
+
+    def city_code(self, city: str) -> int:
+        return self._code(self._city_codes, city)
+
+    def append(self, forecast: dict, city_code: int = -1):
+        """Одна запись из data['list']; city_code — из city_code() или -1"""
+        self._reserve(1)
+        main = forecast["main"]
+        wind = forecast["wind"]
+        self._rows[self._size] = (
+            forecast["dt"],
+            main["temp"], main["feels_like"], main["temp_min"], main["temp_max"],
+            main["humidity"], main["pressure"],
+            wind["speed"], wind["deg"],
+            self._code(self._weather_codes, forecast["weather"][0]["main"]),
+            forecast["clouds"]["all"],
+            city_code,
+        )
+        self._size += 1
+
+    def extend(self, forecasts, city: str = None):
+        """Добавляет записи одного города; для списков место выделяется один раз"""
+        if hasattr(forecasts, "__len__"):
+            self._reserve(len(forecasts))
+        city_code = self.city_code(city) if city is not None else -1
+        for forecast in forecasts:
+            self.append(forecast, city_code)
+
+    def truncate(self, size: int):
+        """Откатывает накопитель к первым size записям"""
+        self._size = min(self._size, size)
+
+    def to_frame(self) -> pd.DataFrame:
+        rows = self._rows[:self._size]
+        columns = {"date": rows["dt"].view("datetime64[s]")}
+        for name in NUMERIC_COLUMNS:
+            columns[name] = rows[name]
+        columns["weather"] = pd.Categorical.from_codes(rows["weather"], categories=list(self._weather_codes))
+        if self._city_codes:
+            columns["city"] = pd.Categorical.from_codes(rows["city"], categories=list(self._city_codes))
+        return pd.DataFrame(columns, copy=False)
+
+
+def parse_forecast_columns(data: dict, city: str = None) -> pd.DataFrame:
+    """Колоночный аналог weather_data.parse_forecast для одного ответа API"""
+    columns = ForecastColumns(len(data["list"]))
+    columns.extend(data["list"], city)
+    return columns.to_frame()
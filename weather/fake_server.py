@@ -0,0 +1,199 @@
+"""
+Локальная замена OpenWeatherMap для тестов и нагрузочных прогонов без ключа и сети.
+
+Отвечает на GET /data/2.5/forecast?q=<город>:
+- записанными ответами из каталога recorded/ (python -m weather.fetch
+  cities.txt --out recorded/ пишет их под именами weather.filenames.safe_stem,
+  подходят и файлы с названием города как есть), а для остальных городов —
+  синтетическими (weather.sample_data) с count записями или 404 (--no-synthetic);
+- с задержкой latency ± jitter секунд;
+- с вероятностью error_rate — 503 (Retry-After: 0);
+- с ETag и 304 на If-None-Match, как у настоящего API за CDN.
+
+Запуск:
+    python -m weather.fake_server --port 8000 --latency 0.05 --error-rate 0.01 --count 40
+    python -m weather.fetch cities.txt --base-url http://127.0.0.1:8000/data/2.5/forecast
+"""
+
+import argparse
+import hashlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from pathlib import Path
+import random
+import sys
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+
+from weather.filenames import safe_stem
+from weather.sample_data import make_payload
+
+FORECAST_PATH = "/data/2.5/forecast"
+
+
+class FakeForecastServer(ThreadingHTTPServer):
+    # Очередь listen() по умолчанию 5 — при десятках одновременных соединений
+    # лишние SYN отбрасываются и клиент ждёт повторной отправки ~1 сек
+    request_queue_size = 1024
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address=("127.0.0.1", 0),
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        count: int = 40,
+        recorded: str = None,
+        seed: int = 0,
+        not_found: set = frozenset(),
+        synthetic: bool = True,
+    ):
+        super().__init__(address, ForecastHandler)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.count = count
+        self.seed = seed
+        self.not_found = set(not_found)
+        self.synthetic = synthetic
+        # город -> сколько раз подряд ответить 503 перед нормальным ответом
+        self.failures = {}
+        self.hits = 0
+        self._recorded = {}
+        if recorded:
+            for path in Path(recorded).glob("*.json"):
+                self._recorded[path.stem.casefold()] = path.read_bytes()
+        self._bodies = {}
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{FORECAST_PATH}"
+
+    def recorded_body(self, city: str) -> bytes:
+        """Записанный ответ: файл от weather.fetch --out (safe_stem) или <город>.json"""
+        body = self._recorded.get(safe_stem(city).casefold())
+        if body is None:
+            body = self._recorded.get(city.casefold())
+        return body
+
+    def body(self, city: str) -> bytes:
+        """Тело ответа для города, одинаковое от запроса к запросу (для ETag)"""
+        body = self.recorded_body(city)
+        if body is not None:
+            return body
+        key = city.casefold()
+        with self._lock:
+            body = self._bodies.get(key)
+            if body is None:
+                payload = make_payload(city, count=self.count, seed=self.seed)
+                body = self._bodies[key] = json.dumps(payload, ensure_ascii=False).encode()
+        return body
+
+    def decide(self, city: str) -> int:
+        """Какой статус отдать: 503 из failures/error_rate, 404 для неизвестных, иначе 200"""
+        with self._lock:
+            self.hits += 1
+            if self.failures.get(city):
+                self.failures[city] -= 1
+                return 503
+            if self.error_rate and self._random.random() < self.error_rate:
+                return 503
+            delay = self.latency + (self._random.uniform(-self.jitter, self.jitter) if self.jitter else 0)
+        if delay > 0:
+            time.sleep(delay)
+        if city in self.not_found or (not self.synthetic and self.recorded_body(city) is None):
+            return 404
+        return 200
+
+    def start(self) -> "FakeForecastServer":
+        """Запускает сервер в фоновом потоке (для тестов и бенчмарка)"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+
+class ForecastHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: FakeForecastServer
+
+    def _send(self, status: int, body: bytes = b"", headers: dict = None):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        city = parse_qs(url.query).get("q", [""])[0]
+        if url.path != FORECAST_PATH or not city:
+            self._send(400, b'{"cod": "400", "message": "Nothing to geocode"}', {"Content-Type": "application/json"})
+            return
+
+        status = self.server.decide(city)
+        if status == 503:
+            self._send(503, headers={"Retry-After": "0"})
+            return
+        if status == 404:
+            self._send(404, b'{"cod": "404", "message": "city not found"}', {"Content-Type": "application/json"})
+            return
+
+        body = self.server.body(city)
+        etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, headers={"ETag": etag})
+            return
+        self._send(200, body, {"Content-Type": "application/json; charset=utf-8", "ETag": etag})
+
+    def log_message(self, *args):
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Локальная замена OpenWeatherMap /data/2.5/forecast")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0, help="задержка ответа, сек")
+    parser.add_argument("--jitter", type=float, default=0.0, help="разброс задержки, ± сек")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="доля ответов 503")
+    parser.add_argument("--count", type=int, default=40, help="записей в синтетическом ответе (размер payload)")
+    parser.add_argument("--recorded", help="каталог с записанными ответами <город>.json")
+    parser.add_argument("--no-synthetic", action="store_true", help="404 для городов без записанного ответа")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    server = FakeForecastServer(
+        (args.host, args.port), args.latency, args.jitter, args.error_rate,
+        args.count, args.recorded, args.seed, synthetic=not args.no_synthetic,
+    )
+    print(f"Слушаю {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,232 @@
+"""
+Параллельная загрузка прогнозов OpenWeatherMap для многих городов.
+
+Один requests.Session с пулом соединений (keep-alive, без повторного
+TCP/TLS-рукопожатия на каждый город) раздаётся потокам ThreadPoolExecutor.
+Параллельность ограничена concurrency, у каждого запроса свои таймауты
+на соединение и чтение. Ошибки не прерывают загрузку — они возвращаются
+в FetchResult.error для конкретного города.
+
+Запуск:
+    python -m weather.fetch cities.txt --api-key KEY --out forecasts/
+    python -m weather.fetch cities.txt --base-url http://127.0.0.1:8000/data/2.5/forecast
+    python -m weather.fetch cities.txt --cache weather_cache.sqlite --ttl 10800
+    python -m weather.fetch cities.txt --rate-limit 50 --retries 4
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+import sys
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from weather.cache import DEFAULT_TTL, ForecastCache
+from weather.filenames import safe_stem
+from weather.throttle import RetryPolicy, ThrottledSession, TokenBucket
+
+BASE_URL = "http://api.openweathermap.org/data/2.5/forecast"
+DEFAULT_TIMEOUT = (3.05, 10)  # (connect, read) в секундах
+
+
+@dataclass
+class FetchResult:
+    city: str
+    status: int = None
+    data: dict = None
+    error: str = None
+    elapsed: float = 0.0
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def make_session(
+    pool_size: int = 16,
+    rate_limit: float = None,
+    burst: float = None,
+    retry: RetryPolicy = None,
+) -> requests.Session:
+    """
+    Session, у которого пул соединений не меньше числа рабочих потоков.
+    С rate_limit (запросов/сек) и/или retry получается ThrottledSession:
+    квота API, повторы на 429/5xx с backoff и счётчики по хостам.
+    """
+    if rate_limit is not None or retry is not None:
+        limiter = TokenBucket(rate_limit, burst) if rate_limit is not None else None
+        session = ThrottledSession(limiter, retry)
+    else:
+        session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def error_message(response: requests.Response) -> str:
+    """Текст ошибки API; у 5xx от прокси тело бывает пустым или не JSON"""
+    try:
+        message = response.json().get('message', 'Неизвестная ошибка')
+    except (ValueError, AttributeError):
+        message = response.reason or 'Неизвестная ошибка'
+    return f"Ошибка {response.status_code}: {message}"
+
+
+def fetch_forecast(
+    session: requests.Session,
+    city: str,
+    api_key: str,
+    units: str = "metric",
+    base_url: str = BASE_URL,
+    timeout=DEFAULT_TIMEOUT,
+    cache: ForecastCache = None,
+) -> FetchResult:
+    """
+    С cache свежая запись возвращается без сети, а устаревшая
+    перепроверяется условным запросом по ETag/Last-Modified.
+    """
+    start = time.monotonic()
+    result = FetchResult(city)
+    entry = cache.get(city, units) if cache is not None else None
+    if entry is not None and entry.is_fresh(cache.ttl):
+        result.status, result.data, result.cached = 200, entry.data, True
+        result.elapsed = time.monotonic() - start
+        return result
+    try:
+        response = session.get(
+            base_url,
+            params={"q": city, "appid": api_key, "units": units},
+            headers=entry.validators() if entry is not None else None,
+            timeout=timeout,
+        )
+        result.status = response.status_code
+        if response.status_code == 304 and entry is not None:
+            cache.touch(city, units)
+            result.status, result.data, result.cached = 200, entry.data, True
+        elif response.status_code != 200:
+            result.error = error_message(response)
+        else:
+            data = response.json()
+            if "list" not in data:
+                result.error = f"API не вернул данные. Ответ: {data}"
+            else:
+                result.data = data
+                if cache is not None:
+                    cache.put(
+                        city, units, data,
+                        response.headers.get("ETag"), response.headers.get("Last-Modified"),
+                    )
+    except (requests.RequestException, ValueError) as e:
+        result.error = f"{type(e).__name__}: {e}"
+    result.elapsed = time.monotonic() - start
+    return result
+
+
+def fetch_forecasts(
+    cities: list[str],
+    api_key: str,
+    units: str = "metric",
+    concurrency: int = 16,
+    timeout=DEFAULT_TIMEOUT,
+    base_url: str = BASE_URL,
+    session: requests.Session = None,
+    cache: ForecastCache = None,
+) -> list[FetchResult]:
+    """Загружает прогнозы для всех городов, результаты в порядке cities"""
+    results = [None] * len(cities)
+    pending = []
+    for index, city in enumerate(cities):
+        # Свежие записи кэша отдаём сразу: при тёплом кэше не создаются ни сессия, ни потоки
+        entry = cache.get_fresh(city, units) if cache is not None else None
+        if entry is not None:
+            results[index] = FetchResult(city, 200, entry.data, cached=True)
+        else:
+            pending.append(index)
+    if not pending:
+        return results
+
+    own_session = session is None
+    session = session or make_session(concurrency)
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            fetched = pool.map(
+                lambda city: fetch_forecast(session, city, api_key, units, base_url, timeout, cache),
+                [cities[index] for index in pending],
+            )
+            for index, result in zip(pending, fetched):
+                results[index] = result
+    finally:
+        if own_session:
+            session.close()
+    return results
+
+
+def read_cities(path) -> list[str]:
+    """Один город на строку, пустые строки и строки с # пропускаются"""
+    with open(path, encoding="utf-8") as file:
+        return [line.strip() for line in file if line.strip() and not line.lstrip().startswith("#")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Загрузка прогнозов погоды для списка городов")
+    parser.add_argument("cities", help="файл со списком городов, по одному на строку")
+    parser.add_argument("--api-key", default=os.environ.get("OWM_API_KEY", ""), help="ключ OpenWeatherMap (или OWM_API_KEY)")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--units", default="metric")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--connect-timeout", type=float, default=DEFAULT_TIMEOUT[0])
+    parser.add_argument("--read-timeout", type=float, default=DEFAULT_TIMEOUT[1])
+    parser.add_argument("--out", help="каталог, куда сохранить <город>.json")
+    parser.add_argument("--rate-limit", type=float, help="не больше N запросов в секунду (квота API)")
+    parser.add_argument("--retries", type=int, default=4, help="повторов на 429/5xx и сетевых ошибках")
+    parser.add_argument("--cache", help="файл SQLite-кэша ответов")
+    parser.add_argument("--ttl", type=float, default=DEFAULT_TTL, help="время жизни записи кэша, сек")
+    args = parser.parse_args(argv)
+
+    cities = read_cities(args.cities)
+    cache = ForecastCache(args.cache, args.ttl) if args.cache else None
+    session = make_session(args.concurrency, args.rate_limit, retry=RetryPolicy(retries=args.retries))
+    start = time.monotonic()
+    try:
+        results = fetch_forecasts(
+            cities, args.api_key, args.units, args.concurrency,
+            (args.connect_timeout, args.read_timeout), args.base_url, session, cache,
+        )
+    finally:
+        session.close()
+        if cache is not None:
+            cache.close()
+    elapsed = time.monotonic() - start
+
+    if args.out:
+        out = Path(args.out)
+        out.mkdir(parents=True, exist_ok=True)
+        for result in results:
+            if result.ok:
+                with open(out / f"{safe_stem(result.city)}.json", "w", encoding="utf-8") as file:
+                    json.dump(result.data, file, ensure_ascii=False)
+
+    failed = [result for result in results if not result.ok]
+    for result in failed:
+        print(f"{result.city}: {result.error}", file=sys.stderr)
+    for host, stats in session.host_stats().items():
+        latency = stats["latency"]
+        print(
+            f"{host}: запросов {stats['requests']}, ошибок {stats['errors']}, повторов {stats['retries']}, "
+            f"статусы {stats['statuses']}, p50 {latency.get('p50', 0):.3f} сек, p99 {latency.get('p99', 0):.3f} сек",
+            file=sys.stderr,
+        )
+    cached = sum(result.cached for result in results)
+    print(f"Загружено {len(results) - len(failed)}/{len(results)} городов (из кэша {cached}) за {elapsed:.2f} сек")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
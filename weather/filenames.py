@@ -0,0 +1,18 @@
+"""
+Имена файлов из названий городов.
+
+Название приходит из файла городов или ответа API и может содержать
+"/", "..", пробелы и т.п. Всё, кроме букв и цифр, заменяется на "_";
+если имя пришлось изменить, добавляется короткий хеш исходного названия,
+чтобы "New York" и "New-York" не записались в один файл.
+"""
+
+import hashlib
+
+
+def safe_stem(city: str) -> str:
+    stem = "".join(char if char.isalnum() else "_" for char in city)
+    if stem == city and stem:
+        return stem
+    digest = hashlib.blake2b(city.encode("utf-8", "surrogateescape"), digest_size=4).hexdigest()
+    return f"{stem}-{digest}"
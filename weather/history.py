@@ -0,0 +1,98 @@
+"""
+История прогнозов в виде партиционированного Parquet-датасета.
+
+weather_data.csv перезаписывается на каждом запуске, а CSV долго читать.
+Здесь каждая пара (город, день) — отдельный файл:
+
+    <root>/city=<город>/day=<YYYY-MM-DD>/part.parquet
+
+append() дописывает новые строки в нужные партиции и убирает дубликаты
+по (city, dt) — более свежий прогноз на то же время заменяет старый.
+Партиция перезаписывается атомарно (временный файл + os.replace).
+load() читает только нужные партиции через pyarrow.dataset, без разбора CSV.
+"""
+
+from datetime import date
+import os
+from pathlib import Path
+from urllib.parse import quote
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+PART_FILE = "part.parquet"
+PARTITIONING = ds.partitioning(pa.schema([("city", pa.string()), ("day", pa.string())]), flavor="hive")
+
+
+class WeatherHistory:
+    def __init__(self, root: str = "weather_history"):
+        self.root = Path(root)
+
+    def _partition_path(self, city: str, day: str) -> Path:
+        # Имена городов бывают с пробелами и не-ASCII — кодируем как в hive-партициях pyarrow
+        return self.root / f"city={quote(city, safe='')}" / f"day={day}" / PART_FILE
+
+    def append(self, df: pd.DataFrame, city: str = None) -> int:
+        """
+        Дописывает прогноз. Город берётся из колонки city или из аргумента.
+        Возвращает, сколько строк теперь лежит в затронутых партициях.
+        """
+        if city is not None:
+            df = df.assign(city=city)
+        if "city" not in df:
+            raise ValueError("Нужна колонка city или аргумент city")
+
+        df = df.drop(columns=[column for column in ("time", "day") if column in df])
+        days = df["date"].dt.strftime("%Y-%m-%d")
+        written = 0
+        for (city_name, day), part in df.groupby([df["city"].astype(str), days], observed=True, sort=False):
+            written += self._write_partition(city_name, day, part.drop(columns="city"))
+        return written
+
+    def _write_partition(self, city: str, day: str, part: pd.DataFrame) -> int:
+        path = self._partition_path(city, day)
+        if path.exists():
+            old = pq.read_table(path).to_pandas()
+            part = pd.concat([old, part], ignore_index=True)
+        part = (
+            part.drop_duplicates(subset="date", keep="last")
+            .sort_values("date")
+            .reset_index(drop=True)
+        )
+        if isinstance(part["weather"].dtype, pd.CategoricalDtype):
+            part["weather"] = part["weather"].astype(str)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        pq.write_table(pa.Table.from_pandas(part, preserve_index=False), tmp_path)
+        os.replace(tmp_path, path)
+        return len(part)
+
+    def load(self, cities: list[str] = None, start: date = None, end: date = None) -> pd.DataFrame:
+        """Загружает историю; фильтры по городам и дням [start, end] отсекают партиции целиком"""
+        if not self.root.exists():
+            return pd.DataFrame()
+        dataset = ds.dataset(self.root, format="parquet", partitioning=PARTITIONING)
+        condition = None
+
+        def combine(expression):
+            nonlocal condition
+            condition = expression if condition is None else condition & expression
+
+        if cities is not None:
+            combine(ds.field("city").isin(list(cities)))
+        if start is not None:
+            combine(ds.field("day") >= start.isoformat())
+        if end is not None:
+            combine(ds.field("day") <= end.isoformat())
+
+        table = dataset.to_table(filter=condition)
+        df = table.to_pandas()
+        if df.empty:
+            return df
+        df = df.drop(columns="day")
+        df["city"] = df["city"].astype("category")
+        df["weather"] = df["weather"].astype("category")
+        return df.sort_values(["city", "date"], ignore_index=True)
@@ -0,0 +1,133 @@
+"""
+Нагрузочный прогон всего конвейера: загрузка -> разбор -> история -> графики.
+
+По умолчанию поднимает в процессе weather.fake_server с заданной задержкой,
+долей 503 и размером ответа, так что ключ API и сеть не нужны. С --base-url
+гоняет конвейер против уже запущенного сервера (например, fake_server с
+записанными ответами). Печатает время каждой стадии и города в секунду:
+
+    python -m weather.pipeline_bench --cities 200 --latency 0.05 --error-rate 0.02
+    python -m weather.pipeline_bench --cities 50 --no-render --json bench.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from weather.columnar import parse_forecast_columns
+from weather.fake_server import FakeForecastServer
+from weather.fetch import fetch_forecasts, make_session
+from weather.history import WeatherHistory
+from weather.render import render_cities
+from weather.throttle import RetryPolicy
+
+
+def run_pipeline(
+    cities: list[str],
+    base_url: str,
+    out_dir,
+    concurrency: int = 16,
+    retries: int = 3,
+    render: bool = True,
+    workers: int = None,
+) -> dict:
+    """Прогоняет города через все стадии; возвращает секунды по стадиям и счётчики"""
+    stages = {}
+    session = make_session(concurrency, retry=RetryPolicy(retries=retries, backoff=0.05))
+    try:
+        start = time.perf_counter()
+        results = fetch_forecasts(cities, "bench", concurrency=concurrency, base_url=base_url, session=session)
+        stages["fetch"] = time.perf_counter() - start
+        host_stats = session.host_stats()
+    finally:
+        session.close()
+
+    ok = [result for result in results if result.ok]
+    start = time.perf_counter()
+    frames = [(result.city, parse_forecast_columns(result.data, result.city)) for result in ok]
+    stages["parse"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    history = WeatherHistory(os.path.join(out_dir, "history"))
+    if frames:
+        history.append(pd.concat([df for _, df in frames], ignore_index=True))
+    stages["store"] = time.perf_counter() - start
+
+    if render and frames:
+        start = time.perf_counter()
+        render_cities(frames, os.path.join(out_dir, "charts"), workers)
+        stages["render"] = time.perf_counter() - start
+
+    total = sum(stages.values())
+    return {
+        "cities": len(cities),
+        "ok": len(ok),
+        "failed": len(results) - len(ok),
+        "stages": stages,
+        "total": total,
+        "cities_per_sec": len(ok) / total if total else 0.0,
+        "hosts": host_stats,
+    }
+
+
+def format_report(report: dict) -> str:
+    lines = [f"{'стадия':<8} {'сек':>8} {'городов/сек':>12}"]
+    for stage, seconds in report["stages"].items():
+        rate = report["ok"] / seconds if seconds else float("inf")
+        lines.append(f"{stage:<8} {seconds:>8.3f} {rate:>12.1f}")
+    lines.append(f"{'всего':<8} {report['total']:>8.3f} {report['cities_per_sec']:>12.1f}")
+    lines.append(f"успешно {report['ok']} из {report['cities']}, ошибок {report['failed']}")
+    for host, stats in report["hosts"].items():
+        lines.append(f"{host}: запросов {stats['requests']}, повторов {stats['retries']}, "
+                     f"p99 {stats['latency'].get('p99', 0) * 1000:.1f} мс")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Бенчмарк конвейера прогнозов на локальном сервере")
+    parser.add_argument("--cities", type=int, default=100)
+    parser.add_argument("--base-url", help="URL уже запущенного сервера (по умолчанию поднимается fake_server)")
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--count", type=int, default=40, help="записей в ответе")
+    parser.add_argument("--recorded", help="каталог с записанными ответами <город>.json")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="процессов для отрисовки")
+    parser.add_argument("--no-render", action="store_true")
+    parser.add_argument("--out", help="каталог для истории и графиков (по умолчанию временный)")
+    parser.add_argument("--json", help="сохранить результат в JSON")
+    args = parser.parse_args(argv)
+
+    cities = [f"City{i}" for i in range(args.cities)]
+    server = None
+    if args.base_url is None:
+        server = FakeForecastServer(
+            latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+            count=args.count, recorded=args.recorded,
+        ).start()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            report = run_pipeline(
+                cities, args.base_url or server.url, args.out or tmp,
+                args.concurrency, args.retries, not args.no_render, args.workers,
+            )
+    finally:
+        if server is not None:
+            server.stop()
+
+    print(format_report(report))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+Быстрая пакетная отрисовка графиков погоды без окна и без pyplot.
+
+weather_data.plot_weather строит фигуру через глобальное состояние pyplot
+и seaborn, а стиль настраивается при импорте. Для ночных отчётов по сотням
+городов здесь:
+
+- бэкенд Agg напрямую (Figure + FigureCanvasAgg), pyplot не импортируется;
+- одна Figure с осями на процесс, которая очищается и переиспользуется;
+- стиль ставится в инициализаторе процесса, а не при импорте модуля;
+- города раскладываются по ProcessPoolExecutor.
+
+Бенчмарк (графики в секунду):
+    python -m weather.render --cities 200 --workers 4
+    python -m weather.render --cities 20 --workers 1 --baseline
+"""
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import os
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+import matplotlib
+import matplotlib.style
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import matplotlib.dates as mdates
+from matplotlib.figure import Figure
+import numpy as np
+import pandas as pd
+
+from weather.filenames import safe_stem
+
+STYLE = "seaborn-v0_8-whitegrid"
+
+
+def chart_filename(city: str) -> str:
+    return safe_stem(city) + ".png"
+
+
+class ChartRenderer:
+    """Четыре панели как в weather_data.plot_weather на переиспользуемой фигуре"""
+
+    def __init__(self, figsize=(15, 10), dpi: int = 100):
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(self.figure)
+        axes = self.figure.subplots(2, 2)
+        self.ax_temp, self.ax_humidity, self.ax_wind, self.ax_weather = axes.flat
+        self.ax_pressure = self.ax_humidity.twinx()
+        # Фиксированные поля вместо tight_layout: тот считает текст на каждом графике
+        self.figure.subplots_adjust(left=0.06, right=0.88, bottom=0.1, top=0.95, wspace=0.3, hspace=0.45)
+
+    def _clear(self):
+        for ax in (self.ax_temp, self.ax_humidity, self.ax_pressure, self.ax_wind, self.ax_weather):
+            ax.cla()
+        # cla() сбрасывает то, что настроил twinx
+        self.ax_pressure.yaxis.tick_right()
+        self.ax_pressure.yaxis.set_label_position("right")
+        self.ax_pressure.xaxis.set_visible(False)
+        self.ax_pressure.patch.set_visible(False)
+
+    def render(self, df: pd.DataFrame, city: str, path):
+        self._clear()
+        dates = df["date"].to_numpy()
+        locator = mdates.AutoDateLocator()
+        formatter = mdates.ConciseDateFormatter(locator)
+
+        # 1. График температуры
+        ax = self.ax_temp
+        ax.plot(dates, df["temp"].to_numpy(), label="Температура")
+        ax.plot(dates, df["feels_like"].to_numpy(), label="Ощущается как")
+        ax.set_title(f"Температура в {city}")
+        ax.set_xlabel("Дата и время")
+        ax.set_ylabel("Температура (°C)")
+        ax.xaxis.set_major_locator(locator)
+        ax.xaxis.set_major_formatter(formatter)
+        ax.legend()
+
+        # 2. График влажности и давления
+        ax = self.ax_humidity
+        ax.plot(dates, df["humidity"].to_numpy(), color="blue", label="Влажность")
+        ax.set_ylabel("Влажность (%)", color="blue")
+        ax.set_title("Влажность и давление")
+        ax.xaxis.set_major_locator(locator)
+        ax.xaxis.set_major_formatter(formatter)
+        self.ax_pressure.plot(dates, df["pressure"].to_numpy(), color="red", label="Давление")
+        self.ax_pressure.set_ylabel("Давление (hPa)", color="red")
+
+        # 3. График скорости ветра: столбцы по времени суток, цвет — день
+        ax = self.ax_wind
+        wind = pd.DataFrame({
+            "time": df["date"].dt.strftime("%H:%M"),
+            "day": df["date"].dt.date,
+            "wind_speed": df["wind_speed"].to_numpy(),
+        }).pivot_table(index="time", columns="day", values="wind_speed", aggfunc="mean")
+        positions = np.arange(len(wind.index))
+        width = 0.8 / max(len(wind.columns), 1)
+        colors = matplotlib.colormaps["viridis"](np.linspace(0, 1, max(len(wind.columns), 1)))
+        for i, day in enumerate(wind.columns):
+            ax.bar(positions + (i - (len(wind.columns) - 1) / 2) * width, wind[day].to_numpy(),
+                   width, label=str(day), color=colors[i])
+        ax.set_xticks(positions, wind.index, rotation=45)
+        ax.set_title("Скорость ветра по времени суток")
+        ax.set_xlabel("Время")
+        ax.set_ylabel("Скорость ветра (м/с)")
+        ax.legend(title="День", bbox_to_anchor=(1.05, 1), loc="upper left")
+
+        # 4. Распределение погодных условий
+        ax = self.ax_weather
+        weather_counts = df["weather"].value_counts()
+        weather_counts = weather_counts[weather_counts > 0]
+        ax.pie(weather_counts.to_numpy(), labels=weather_counts.index.astype(str), autopct="%1.1f%%", startangle=90)
+        ax.set_title("Распределение погодных условий")
+
+        self.figure.savefig(path)
+
+
+# Состояние процесса-исполнителя: своя фигура в каждом процессе
+_renderer: ChartRenderer = None
+
+
+def _init_worker(style: str = STYLE):
+    global _renderer
+    matplotlib.style.use(style)
+    _renderer = ChartRenderer()
+
+
+def _render_one(task) -> str:
+    city, df, path = task
+    _renderer.render(df, city, path)
+    return str(path)
+
+
+def render_cities(frames, out_dir, workers: int = None, chunksize: int = 4, style: str = STYLE) -> list[str]:
+    """
+    frames — пары (город, DataFrame в формате columnar/parse_forecast).
+    Возвращает пути к PNG в том же порядке. workers=1 — без пула процессов;
+    стиль тогда действует только на время отрисовки и не меняет глобальные
+    настройки matplotlib вызывающей программы.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tasks = [(city, df, out_dir / chart_filename(city)) for city, df in frames]
+    if workers == 1:
+        with matplotlib.style.context(style):
+            renderer = ChartRenderer()
+            for city, df, path in tasks:
+                renderer.render(df, city, path)
+        return [str(path) for _, _, path in tasks]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(style,)) as pool:
+        return list(pool.map(_render_one, tasks, chunksize=chunksize))
+
+
+def main(argv=None):
+    from weather.columnar import parse_forecast_columns
+    from weather.sample_data import make_payload
+
+    parser = argparse.ArgumentParser(description="Бенчмарк пакетной отрисовки графиков погоды")
+    parser.add_argument("--cities", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--out", help="каталог для PNG (по умолчанию временный)")
+    parser.add_argument("--baseline", action="store_true", help="для сравнения отрисовать те же города через pyplot+seaborn")
+    args = parser.parse_args(argv)
+
+    frames = [
+        (f"City{i}", parse_forecast_columns(make_payload(f"City{i}", seed=i)))
+        for i in range(args.cities)
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        out = args.out or tmp
+        start = time.perf_counter()
+        render_cities(frames, out, args.workers)
+        elapsed = time.perf_counter() - start
+        print(f"Agg + ProcessPool: {args.cities} графиков за {elapsed:.2f} сек, "
+              f"{args.cities / elapsed:.1f} графиков/сек (workers={args.workers})")
+
+        if args.baseline:
+            matplotlib.use("Agg")
+            from weather.weather_data import plot_weather, setup_style
+
+            setup_style()
+            start = time.perf_counter()
+            for city, df in frames:
+                df = df.assign(time=df["date"].dt.time, day=df["date"].dt.date)
+                plot_weather(df, city, os.path.join(tmp, "baseline_" + chart_filename(city)))
+            elapsed = time.perf_counter() - start
+            print(f"pyplot + seaborn: {args.cities} графиков за {elapsed:.2f} сек, "
+                  f"{args.cities / elapsed:.1f} графиков/сек")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""
+Синтетические ответы /data/2.5/forecast для тестов и бенчмарков.
+
+Форма ответа повторяет OpenWeatherMap: шаг 3 часа, по умолчанию 40 записей (5 дней).
+С одинаковым seed данные воспроизводятся.
+"""
+
+from datetime import datetime, timezone
+import random
+
+WEATHER_KINDS = ("Clear", "Clouds", "Rain", "Snow", "Drizzle", "Thunderstorm", "Mist")
+STEP = 3 * 60 * 60
+
+
+def make_entry(dt: int, rng: random.Random) -> dict:
+    temp = round(rng.uniform(-15, 30), 2)
+    return {
+        "dt": dt,
+        "main": {
+            "temp": temp,
+            "feels_like": round(temp - rng.uniform(0, 4), 2),
+            "temp_min": round(temp - rng.uniform(0, 2), 2),
+            "temp_max": round(temp + rng.uniform(0, 2), 2),
+            "pressure": rng.randint(980, 1040),
+            "sea_level": rng.randint(980, 1040),
+            "grnd_level": rng.randint(960, 1030),
+            "humidity": rng.randint(20, 100),
+            "temp_kf": 0,
+        },
+        "weather": [{"id": 800, "main": rng.choice(WEATHER_KINDS), "description": "", "icon": "01d"}],
+        "clouds": {"all": rng.randint(0, 100)},
+        "wind": {"speed": round(rng.uniform(0, 15), 2), "deg": rng.randint(0, 359), "gust": round(rng.uniform(0, 20), 2)},
+        "visibility": 10000,
+        "pop": round(rng.random(), 2),
+        "sys": {"pod": "d"},
+        "dt_txt": datetime.fromtimestamp(dt, timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+def make_payload(city: str, count: int = 40, start: int = 1_700_006_400, seed: int = None) -> dict:
+    """Ответ API для города; start — время первой записи (UTC, кратно 3 часам)"""
+    rng = random.Random(f"{city}:{seed}" if seed is not None else None)
+    return {
+        "cod": "200",
+        "message": 0,
+        "cnt": count,
+        "list": [make_entry(start + i * STEP, rng) for i in range(count)],
+        "city": {"id": 0, "name": city, "country": "", "timezone": 0},
+    }
@@ -0,0 +1,166 @@
+"""
+Потоковый разбор ответа /data/2.5/forecast.
+
+response.json() читает всё тело и строит полное дерево словарей до того,
+как используется первая запись из list. Здесь тело читается кусками
+(response.iter_content), верхний объект разбирается вручную, а элементы
+list декодируются по одному (json.JSONDecoder.raw_decode, сишный сканер)
+и сразу уходят в ForecastColumns. В памяти одновременно лежит только
+текущий кусок и одна запись — пиковая память не зависит от размера ответа.
+"""
+
+import codecs
+import json
+import time
+from typing import Iterable, Iterator
+
+import requests
+
+from weather.columnar import ForecastColumns
+from weather.fetch import BASE_URL, DEFAULT_TIMEOUT, FetchResult, error_message
+
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+
+class _TextStream:
+    """Буфер текста поверх итератора байтовых кусков"""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Дочитывает следующий кусок; уже разобранный текст отбрасывается"""
+        if self.eof:
+            return False
+        for chunk in self._chunks:
+            text = self._utf8.decode(chunk)
+            if text:
+                self.buf = self.buf[self.pos:] + text
+                self.pos = 0
+                return True
+        self.eof = True
+        self.buf = self.buf[self.pos:] + self._utf8.decode(b"", final=True)
+        self.pos = 0
+        return False
+
+    def peek(self) -> str:
+        """Следующий непробельный символ ('' в конце потока)"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def take(self, expected: str = None) -> str:
+        char = self.peek()
+        if not char or (expected is not None and char != expected):
+            raise ValueError(f"Ожидался {expected or 'символ'!r}, получено {char!r} (позиция {self.pos})")
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Декодирует одно JSON-значение целиком, дочитывая куски по мере надобности"""
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+                # Число в самом конце буфера может продолжиться в следующем куске
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.fill()
+
+
+def iter_forecast_entries(chunks: Iterable[bytes], meta: dict = None) -> Iterator[dict]:
+    """
+    Отдаёт записи list по одной. Остальные ключи верхнего уровня
+    (cod, message, cnt, city) складываются в meta, а meta["list"] —
+    число записей (если ключа list в ответе не было, его нет и в meta).
+    """
+    stream = _TextStream(chunks)
+    stream.take("{")
+    if stream.peek() == "}":
+        return
+    while True:
+        key = stream.value()
+        stream.take(":")
+        if key == "list":
+            count = 0
+            stream.take("[")
+            if stream.peek() == "]":
+                stream.take()
+            else:
+                while True:
+                    yield stream.value()
+                    count += 1
+                    separator = stream.take()
+                    if separator == "]":
+                        break
+                    if separator != ",":
+                        raise ValueError(f"Ожидался ',' или ']', получено {separator!r}")
+            if meta is not None:
+                meta["list"] = count
+        else:
+            value = stream.value()
+            if meta is not None:
+                meta[key] = value
+        separator = stream.take()
+        if separator == "}":
+            return
+        if separator != ",":
+            raise ValueError(f"Ожидался ',' или '}}', получено {separator!r}")
+
+
+def stream_forecast(
+    session: requests.Session,
+    city: str,
+    api_key: str,
+    columns: ForecastColumns,
+    units: str = "metric",
+    base_url: str = BASE_URL,
+    timeout=DEFAULT_TIMEOUT,
+    chunk_size: int = 16 * 1024,
+) -> FetchResult:
+    """
+    Как fetch_forecast, но записи прогноза сразу пишутся в columns.
+    result.data — метаданные ответа без list. При ошибке посреди потока
+    уже добавленные записи города из columns убираются.
+    """
+    start = time.monotonic()
+    result = FetchResult(city)
+    size_before = len(columns)
+    try:
+        with session.get(
+            base_url,
+            params={"q": city, "appid": api_key, "units": units},
+            timeout=timeout,
+            stream=True,
+        ) as response:
+            result.status = response.status_code
+            if response.status_code != 200:
+                result.error = error_message(response)
+            else:
+                meta = {}
+                city_code = columns.city_code(city)
+                for forecast in iter_forecast_entries(response.iter_content(chunk_size), meta):
+                    columns.append(forecast, city_code)
+                if "list" not in meta:
+                    result.error = f"API не вернул данные. Ответ: {meta}"
+                else:
+                    result.data = meta
+    except (requests.RequestException, ValueError, KeyError) as e:
+        result.error = f"{type(e).__name__}: {e}"
+    if result.error is not None:
+        columns.truncate(size_before)
+    result.elapsed = time.monotonic() - start
+    return result
@@ -0,0 +1,14 @@
+import pytest
+
+from weather.fake_server import FakeForecastServer
+
+
+@pytest.fixture
+def server():
+    with FakeForecastServer(latency=0.05, count=8, seed=0, not_found={"Nowhere"}) as server:
+        yield server
+
+
+@pytest.fixture
+def base_url(server):
+    return server.url
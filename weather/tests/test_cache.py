@@ -0,0 +1,37 @@
+import time
+
+from weather.cache import ForecastCache
+from weather.fetch import fetch_forecasts, make_session, fetch_forecast
+
+
+def test_warm_cache_makes_no_requests(server, tmp_path):
+    cities = ["Moscow", "London", "Berlin"]
+    with ForecastCache(str(tmp_path / "cache.sqlite")) as cache:
+        cold = fetch_forecasts(cities, "key", base_url=server.url, cache=cache)
+        assert server.hits == 3
+        assert not any(result.cached for result in cold)
+
+        warm = fetch_forecasts([" moscow", "London", "Berlin"], "key", base_url=server.url, cache=cache)
+        assert server.hits == 3
+        assert all(result.cached for result in warm)
+        assert warm[1].data == cold[1].data
+
+
+def test_expired_entry_is_revalidated_with_etag(server, tmp_path):
+    with ForecastCache(str(tmp_path / "cache.sqlite"), ttl=0.01) as cache, make_session(1) as session:
+        first = fetch_forecast(session, "Moscow", "key", base_url=server.url, cache=cache)
+        time.sleep(0.02)
+        second = fetch_forecast(session, "Moscow", "key", base_url=server.url, cache=cache)
+
+        assert server.hits == 2
+        assert second.cached
+        assert second.data == first.data
+        assert cache.get("Moscow").fetched_at > time.time() - 1
+
+
+def test_purge_expired(tmp_path):
+    with ForecastCache(str(tmp_path / "cache.sqlite"), ttl=0) as cache:
+        cache.put("Moscow", "metric", {"list": []})
+        assert cache.get_fresh("Moscow") is None
+        assert cache.purge_expired() == 1
+        assert cache.get("Moscow") is None
@@ -0,0 +1,42 @@
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from weather.columnar import ForecastColumns, parse_forecast_columns
+
+
+def make_forecast(i: int, weather: str = "Rain") -> dict:
+    dt = 1_700_000_000 + i * 10_800
+    return {
+        "dt": dt,
+        "main": {"temp": 1.5 + i, "feels_like": 0.5 + i, "temp_min": 1.0, "temp_max": 2.0,
+                 "pressure": 1012, "humidity": 80},
+        "weather": [{"main": weather}],
+        "clouds": {"all": 75},
+        "wind": {"speed": 3.2, "deg": 180},
+        "dt_txt": datetime.fromtimestamp(dt, timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+def test_matches_dict_based_parsing():
+    data = {"list": [make_forecast(i, "Rain" if i % 2 else "Clouds") for i in range(5)]}
+    df = parse_forecast_columns(data)
+
+    assert list(df["date"]) == list(pd.to_datetime([item["dt_txt"] for item in data["list"]]))
+    assert df["temp"].dtype == np.float32
+    assert df["pressure"].dtype == np.float32
+    np.testing.assert_allclose(df["temp"], [item["main"]["temp"] for item in data["list"]])
+    assert list(df["weather"]) == ["Clouds", "Rain", "Clouds", "Rain", "Clouds"]
+    assert "city" not in df
+
+
+def test_frame_shares_memory_with_builder():
+    columns = ForecastColumns(capacity=2)
+    columns.extend([make_forecast(i) for i in range(3)], city="Moscow")
+    columns.extend([make_forecast(i) for i in range(2)], city="London")
+    df = columns.to_frame()
+
+    assert len(columns) == 5
+    assert list(df["city"]) == ["Moscow"] * 3 + ["London"] * 2
+    assert np.shares_memory(df["temp"].to_numpy(), columns._rows)
@@ -0,0 +1,67 @@
+import json
+
+import requests
+
+from weather.fake_server import FakeForecastServer
+from weather.fetch import main as fetch_main
+from weather.pipeline_bench import main as bench_main, run_pipeline
+from weather.sample_data import make_payload
+
+
+def test_replays_recorded_responses(tmp_path):
+    recorded = {"cod": "200", "cnt": 1, "list": make_payload("Moscow", count=1, seed=3)["list"]}
+    (tmp_path / "Moscow.json").write_text(json.dumps(recorded), encoding="utf-8")
+
+    with FakeForecastServer(recorded=tmp_path, synthetic=False) as server:
+        assert requests.get(server.url, params={"q": "moscow"}).json() == recorded
+        assert requests.get(server.url, params={"q": "London"}).status_code == 404
+        assert requests.get(server.url).status_code == 400
+
+
+def test_payload_size_and_error_rate():
+    with FakeForecastServer(count=5, error_rate=1.0) as server:
+        assert requests.get(server.url, params={"q": "Moscow"}).status_code == 503
+        server.error_rate = 0.0
+        response = requests.get(server.url, params={"q": "Moscow"})
+        assert len(response.json()["list"]) == 5
+        assert requests.get(
+            server.url, params={"q": "Moscow"}, headers={"If-None-Match": response.headers["ETag"]}
+        ).status_code == 304
+        assert server.hits == 3
+
+
+def test_pipeline_survives_transient_errors(server, tmp_path):
+    server.failures = {"City1": 2}
+    report = run_pipeline(["City0", "City1", "Nowhere"], server.url, tmp_path, render=False)
+
+    assert (report["ok"], report["failed"]) == (2, 1)
+    assert list(report["stages"]) == ["fetch", "parse", "store"]
+    assert (tmp_path / "history" / "city=City1").is_dir()
+    (stats,) = report["hosts"].values()
+    assert stats["retries"] == 2
+
+
+def test_bench_cli_writes_json(tmp_path, capsys):
+    out = tmp_path / "bench.json"
+    assert bench_main(["--cities", "4", "--latency", "0", "--count", "8", "--workers", "1",
+                       "--out", str(tmp_path), "--json", str(out)]) == 0
+    report = json.loads(out.read_text(encoding="utf-8"))
+    assert report["ok"] == 4
+    assert "render" in report["stages"]
+    assert "городов/сек" in capsys.readouterr().out
+
+
+def test_replays_responses_recorded_by_fetch(tmp_path):
+    cities = ["Moscow", "New York", "Baden/Baden"]
+    cities_file = tmp_path / "cities.txt"
+    cities_file.write_text("\n".join(cities) + "\n", encoding="utf-8")
+    recorded = tmp_path / "recorded"
+    with FakeForecastServer(count=3, seed=7) as source:
+        assert fetch_main([str(cities_file), "--base-url", source.url, "--out", str(recorded)]) == 0
+
+    with FakeForecastServer(recorded=recorded, synthetic=False) as server:
+        for city in cities:
+            response = requests.get(server.url, params={"q": city})
+            assert response.status_code == 200
+            assert response.json() == make_payload(city, count=3, seed=7)
+        assert requests.get(server.url, params={"q": "London"}).status_code == 404
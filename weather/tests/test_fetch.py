@@ -0,0 +1,45 @@
+import time
+
+from weather.fetch import fetch_forecasts, main
+
+
+def test_fetches_cities_concurrently(base_url):
+    cities = [f"City{i}" for i in range(40)] + ["Nowhere"]
+    start = time.monotonic()
+    results = fetch_forecasts(cities, "key", concurrency=20, base_url=base_url)
+    elapsed = time.monotonic() - start
+
+    assert [result.city for result in results] == cities
+    assert all(result.ok for result in results[:-1])
+    assert results[-1].status == 404
+    assert "city not found" in results[-1].error
+    # 41 запрос по 50 мс последовательно — больше 2 секунд
+    assert elapsed < 1
+
+
+def test_timeout_is_reported_per_city(server):
+    server.latency = 0.5
+    (result,) = fetch_forecasts(["Slow"], "key", timeout=(1, 0.1), base_url=server.url)
+    assert not result.ok
+    assert "Timeout" in result.error
+
+
+def test_cli_reads_cities_file(base_url, tmp_path, capsys):
+    cities_file = tmp_path / "cities.txt"
+    cities_file.write_text("Moscow\n\n# comment\nLondon\n", encoding="utf-8")
+    out = tmp_path / "out"
+    assert main([str(cities_file), "--base-url", base_url, "--out", str(out)]) == 0
+    assert sorted(path.name for path in out.iterdir()) == ["London.json", "Moscow.json"]
+    assert "2/2" in capsys.readouterr().out
+
+
+def test_cli_sanitises_output_names(base_url, tmp_path):
+    cities_file = tmp_path / "cities.txt"
+    cities_file.write_text("Baden/Baden\n../x\nNew York\nNew-York\n", encoding="utf-8")
+    out = tmp_path / "out"
+    assert main([str(cities_file), "--base-url", base_url, "--out", str(out)]) == 0
+    names = sorted(path.name for path in out.iterdir())
+    assert len(names) == 4
+    assert all(path.parent == out for path in out.iterdir())
+    assert not (tmp_path / "x.json").exists()
+    assert any(name.startswith("Baden_Baden-") for name in names)
@@ -0,0 +1,40 @@
+from datetime import date
+
+from weather.columnar import ForecastColumns
+from weather.history import WeatherHistory
+from weather.tests.test_columnar import make_forecast
+
+
+def build_frame(city_forecasts: dict):
+    columns = ForecastColumns()
+    for city, forecasts in city_forecasts.items():
+        columns.extend(forecasts, city=city)
+    return columns.to_frame()
+
+
+def test_append_deduplicates_on_city_and_dt(tmp_path):
+    history = WeatherHistory(str(tmp_path / "history"))
+    history.append(build_frame({"Moscow": [make_forecast(i) for i in range(8)]}))
+
+    newer = [make_forecast(i) for i in range(4, 12)]
+    for forecast in newer:
+        forecast["main"]["temp"] = 100.0
+    history.append(build_frame({"Moscow": newer, "Нью Йорк": [make_forecast(0)]}))
+
+    df = history.load(cities=["Moscow"])
+    assert len(df) == 12
+    assert df["date"].is_unique
+    assert list(df["temp"][:4]) == [1.5, 2.5, 3.5, 4.5]
+    assert set(df["temp"][4:]) == {100.0}
+    assert list(history.load(cities=["Нью Йорк"])["city"]) == ["Нью Йорк"]
+
+
+def test_load_filters_by_day(tmp_path):
+    history = WeatherHistory(str(tmp_path / "history"))
+    # make_forecast(0) — 2023-11-14 22:13 UTC, шаг 3 часа
+    history.append(build_frame({"Moscow": [make_forecast(i) for i in range(16)]}))
+
+    df = history.load(start=date(2023, 11, 15), end=date(2023, 11, 15))
+    assert len(df) == 8
+    assert set(df["date"].dt.date) == {date(2023, 11, 15)}
+    assert history.load(start=date(2030, 1, 1)).empty
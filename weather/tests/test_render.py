@@ -0,0 +1,33 @@
+import matplotlib
+import pytest
+
+from weather.columnar import parse_forecast_columns
+from weather.render import chart_filename, render_cities
+from weather.sample_data import make_payload
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_render_cities_writes_png_per_city(tmp_path, workers):
+    cities = ["Moscow", "Нью Йорк", "London", "Paris", "Berlin"]
+    frames = [(city, parse_forecast_columns(make_payload(city, count=16, seed=1))) for city in cities]
+
+    paths = render_cities(frames, tmp_path, workers=workers, chunksize=2)
+
+    assert [path.rsplit("/", 1)[-1] for path in paths] == [chart_filename(city) for city in cities]
+    assert paths[0].endswith("/Moscow.png")
+    for path in paths:
+        with open(path, "rb") as file:
+            assert file.read(8) == b"\x89PNG\r\n\x1a\n"
+
+
+def test_render_in_process_keeps_global_style(tmp_path):
+    before = dict(matplotlib.rcParams)
+    frames = [("Moscow", parse_forecast_columns(make_payload("Moscow", count=8, seed=1)))]
+    render_cities(frames, tmp_path, workers=1)
+    assert dict(matplotlib.rcParams) == before
+
+
+def test_chart_filename_distinguishes_cities():
+    names = {chart_filename(city) for city in ["New York", "New-York", "New_York", "NewYork"]}
+    assert len(names) == 4
+    assert chart_filename("../x").startswith("___x-")
@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+from weather.columnar import ForecastColumns, parse_forecast_columns
+from weather.fetch import make_session
+from weather.sample_data import make_payload
+from weather.streaming import iter_forecast_entries, stream_forecast
+
+
+def chunked(data: bytes, size: int):
+    return (data[i:i + size] for i in range(0, len(data), size))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_entries_match_full_decode(chunk_size):
+    payload = make_payload("Санкт-Петербург", count=10, seed=3)
+    body = json.dumps(payload, ensure_ascii=False, indent=1).encode()
+
+    meta = {}
+    entries = list(iter_forecast_entries(chunked(body, chunk_size), meta))
+
+    assert entries == payload["list"]
+    assert meta["city"] == payload["city"]
+    assert meta["cnt"] == 10
+    assert meta["list"] == 10
+
+
+def test_missing_list_and_malformed_body():
+    meta = {}
+    assert list(iter_forecast_entries([b'{"cod": "200", "message": 0}'], meta)) == []
+    assert "list" not in meta
+    with pytest.raises(ValueError):
+        list(iter_forecast_entries([b'{"list": [{"dt": 1} {"dt": 2}]}']))
+
+
+def test_stream_forecast_fills_columns(server):
+    columns = ForecastColumns()
+    with make_session(1) as session:
+        ok = stream_forecast(session, "Moscow", "key", columns, base_url=server.url, chunk_size=64)
+        missing = stream_forecast(session, "Nowhere", "key", columns, base_url=server.url)
+
+    assert ok.ok and ok.data["list"] == 8
+    assert not missing.ok
+    expected = parse_forecast_columns(make_payload("Moscow", count=8, seed=0), city="Moscow")
+    assert columns.to_frame().equals(expected)
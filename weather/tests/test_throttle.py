@@ -0,0 +1,46 @@
+import time
+
+from weather.fetch import fetch_forecasts, make_session
+from weather.throttle import RetryPolicy, TokenBucket
+
+
+def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=50, burst=1)
+    start = time.monotonic()
+    for _ in range(11):
+        bucket.acquire()
+    assert time.monotonic() - start >= 0.19
+
+
+def test_retry_delay_respects_bounds():
+    policy = RetryPolicy(backoff=0.1, max_backoff=1)
+    assert all(0 <= policy.delay(attempt) <= 1 for attempt in range(10))
+    assert policy.delay(0, retry_after="0.5") >= 0.5
+
+
+def test_retry_after_overrides_max_backoff():
+    policy = RetryPolicy(backoff=0.1, max_backoff=1, max_retry_after=300)
+    assert policy.delay(0, retry_after="120") == 120
+    assert policy.delay(0, retry_after="301") is None
+
+
+def test_retries_5xx_and_counts_per_host(server):
+    server.failures["Flaky"] = 2
+    session = make_session(4, rate_limit=100, retry=RetryPolicy(retries=3, backoff=0.01))
+    with session:
+        (flaky, steady) = fetch_forecasts(["Flaky", "Steady"], "key", base_url=server.url, session=session)
+
+    assert flaky.ok and steady.ok
+    (stats,) = session.host_stats().values()
+    assert stats["requests"] == 4
+    assert stats["retries"] == 2
+    assert stats["statuses"] == {503: 2, 200: 2}
+    assert stats["latency"]["count"] == 4
+
+
+def test_gives_up_after_retries(server):
+    server.failures["Down"] = 10
+    with make_session(1, retry=RetryPolicy(retries=1, backoff=0.01)) as session:
+        (result,) = fetch_forecasts(["Down"], "key", base_url=server.url, session=session)
+    assert result.status == 503
+    assert result.error == "Ошибка 503: Service Unavailable"
@@ -0,0 +1,165 @@
+"""
+Устойчивый HTTP-слой для загрузчика прогнозов.
+
+ThrottledSession — requests.Session, который перед каждым запросом берёт
+токен из TokenBucket (квота API), повторяет запрос на 429/5xx и сетевых
+ошибках с экспоненциальной задержкой и случайным разбросом (full jitter),
+учитывает Retry-After и копит по хостам счётчики запросов, ошибок,
+повторов, статусов и гистограмму задержек.
+
+Так как это обычный Session, fetch_forecast и stream_forecast работают
+с ним без изменений — см. weather.fetch.make_session(rate_limit=..., retry=...).
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+from tz.metrics import LatencyHistogram
+
+
+class TokenBucket:
+    """
+    Ограничитель частоты: rate запросов в секунду, всплеск до burst.
+    acquire() резервирует токен и спит ровно до его появления,
+    так что потоки обслуживаются в порядке обращения.
+    """
+
+    def __init__(self, rate: float, burst: float = None):
+        if rate <= 0:
+            raise ValueError("rate должно быть > 0")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+@dataclass
+class RetryPolicy:
+    retries: int = 4
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    # Дольше этого Retry-After не ждём: ответ возвращается без повтора
+    max_retry_after: float = 300.0
+    statuses: frozenset = frozenset({429, 500, 502, 503, 504})
+
+    def delay(self, attempt: int, retry_after: str = None) -> float:
+        """
+        Full jitter: случайно в [0, min(max_backoff, backoff * 2**attempt)], но не
+        меньше Retry-After — он важнее max_backoff, повтор раньше срока сервер
+        сочтёт нарушением. None — сервер просит ждать дольше max_retry_after,
+        повторять не нужно.
+        """
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+        if retry_after:
+            wait = _parse_retry_after(retry_after)
+            if wait > self.max_retry_after:
+                return None
+            delay = max(delay, wait)
+        return delay
+
+
+def _parse_retry_after(value: str) -> float:
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class HostStats:
+    """Счётчики по одному хосту"""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.statuses = Counter()
+        self.latency = LatencyHistogram()
+
+    def summary(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "statuses": dict(self.statuses),
+            "latency": self.latency.summary(),
+        }
+
+
+class ThrottledSession(requests.Session):
+    def __init__(self, limiter: TokenBucket = None, retry: RetryPolicy = None):
+        super().__init__()
+        self.limiter = limiter
+        self.retry = retry or RetryPolicy(retries=0)
+        self._hosts: dict[str, HostStats] = {}
+        self._stats_lock = threading.Lock()
+
+    def _host(self, url: str) -> HostStats:
+        host = urlsplit(url).netloc
+        with self._stats_lock:
+            stats = self._hosts.get(host)
+            if stats is None:
+                stats = self._hosts[host] = HostStats()
+            return stats
+
+    def host_stats(self) -> dict[str, dict]:
+        with self._stats_lock:
+            items = list(self._hosts.items())
+        return {host: stats.summary() for host, stats in items}
+
+    def request(self, method, url, *args, **kwargs):
+        stats = self._host(url)
+        attempt = 0
+        while True:
+            if self.limiter is not None:
+                self.limiter.acquire()
+            start = time.monotonic()
+            try:
+                response = super().request(method, url, *args, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                with self._stats_lock:
+                    stats.requests += 1
+                    stats.errors += 1
+                stats.latency.record(time.monotonic() - start)
+                if attempt >= self.retry.retries:
+                    raise
+                delay = self.retry.delay(attempt)
+            else:
+                with self._stats_lock:
+                    stats.requests += 1
+                    stats.statuses[response.status_code] += 1
+                    if response.status_code >= 500 or response.status_code == 429:
+                        stats.errors += 1
+                stats.latency.record(time.monotonic() - start)
+                if response.status_code not in self.retry.statuses or attempt >= self.retry.retries:
+                    return response
+                delay = self.retry.delay(attempt, response.headers.get("Retry-After"))
+                if delay is None:
+                    return response
+                # Соединение возвращается в пул, даже если ответ читался потоком
+                response.close()
+            with self._stats_lock:
+                stats.retries += 1
+            attempt += 1
+            time.sleep(delay)
@@ -1,57 +1,33 @@
-import requests
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-from datetime import datetime
 
-# Настройки для визуализации (обновлённые)
-plt.style.use('seaborn-v0_8')  # Или другой доступный стиль
-sns.set_theme(style="whitegrid")  # Современный способ установки стиля в seaborn
+from weather.cache import ForecastCache
+from weather.columnar import parse_forecast_columns
+from weather.fetch import fetch_forecast, make_session
+from weather.history import WeatherHistory
 
 API_KEY = "Ваш API-ключ"  # Замените на реальный ключ с сайта openweathermap.org!
-CITY = input("Введите город (например: Moscow, London, Berlin): ")
-URL = f"http://api.openweathermap.org/data/2.5/forecast?q={CITY}&appid={API_KEY}&units=metric"
-
-try:
-    response = requests.get(URL)
-    data = response.json()
-
-    # Проверка ошибок API
-    if response.status_code != 200:
-        print(f"Ошибка {response.status_code}: {data.get('message', 'Неизвестная ошибка')}")
-        exit()
-
-    if 'list' not in data:
-        print("Ошибка: API не вернул данные. Ответ:", data)
-        exit()
-
-    # Парсинг данных
-    weather_data = []
-    for forecast in data['list']:
-        weather_data.append({
-            'date': forecast['dt_txt'],
-            'temp': forecast['main']['temp'],
-            'feels_like': forecast['main']['feels_like'],
-            'temp_min': forecast['main']['temp_min'],
-            'temp_max': forecast['main']['temp_max'],
-            'humidity': forecast['main']['humidity'],
-            'pressure': forecast['main']['pressure'],
-            'wind_speed': forecast['wind']['speed'],
-            'wind_deg': forecast['wind']['deg'],
-            'weather': forecast['weather'][0]['main'],
-            'clouds': forecast['clouds']['all']
-        })
-
-    # Создание DataFrame
-    df = pd.DataFrame(weather_data)
-    df['date'] = pd.to_datetime(df['date'])
+HISTORY_PATH = "weather_history"  # Parquet-история по городам и дням, в отличие от CSV не перезаписывается
+CACHE_PATH = "weather_cache.sqlite"  # Прогноз меняется раз в несколько часов — повторный запуск идёт из кэша
+
+
+def setup_style():
+    # Настройки для визуализации (обновлённые).
+    # Вызываются явно, а не при импорте: пакетной отрисовке (weather.render) они не нужны
+    plt.style.use('seaborn-v0_8')  # Или другой доступный стиль
+    sns.set_theme(style="whitegrid")  # Современный способ установки стиля в seaborn
+
+
+def parse_forecast(data: dict) -> pd.DataFrame:
+    # Парсинг данных: сразу в типизированные колонки, без словаря на каждую запись
+    df = parse_forecast_columns(data)
     df['time'] = df['date'].dt.time
     df['day'] = df['date'].dt.date
+    return df
 
-    # Сохранение в CSV
-    df.to_csv('weather_data.csv', index=False)
-    print("Данные сохранены в weather_data.csv!")
 
+def plot_weather(df: pd.DataFrame, city: str, path: str = 'weather_visualization.png'):
     # Визуализация
     plt.figure(figsize=(15, 10))
 
@@ -59,7 +35,7 @@ try:
     plt.subplot(2, 2, 1)
     sns.lineplot(data=df, x='date', y='temp', label='Температура')
     sns.lineplot(data=df, x='date', y='feels_like', label='Ощущается как')
-    plt.title(f'Температура в {CITY}')
+    plt.title(f'Температура в {city}')
     plt.xlabel('Дата и время')
     plt.ylabel('Температура (°C)')
     plt.xticks(rotation=45)
@@ -93,10 +69,38 @@ try:
     plt.title('Распределение погодных условий')
 
     plt.tight_layout()
-    plt.savefig('weather_visualization.png')
+    plt.savefig(path)
     plt.close()
 
-    print("Визуализация сохранена в weather_visualization.png!")
 
-except Exception as e:
-    print("Ошибка:", e)
\ No newline at end of file
+def main():
+    city = input("Введите город (например: Moscow, London, Berlin): ")
+
+    try:
+        # Для многих городов сразу — weather.fetch.fetch_forecasts / python -m weather.fetch
+        with make_session(1) as session, ForecastCache(CACHE_PATH) as cache:
+            result = fetch_forecast(session, city, API_KEY, cache=cache)
+
+        # Проверка ошибок API
+        if not result.ok:
+            print("Ошибка:", result.error)
+            return
+
+        df = parse_forecast(result.data)
+
+        # Сохранение в CSV
+        df.to_csv('weather_data.csv', index=False)
+        print("Данные сохранены в weather_data.csv!")
+        WeatherHistory(HISTORY_PATH).append(df, city=city)
+        print(f"История дополнена в {HISTORY_PATH}/")
+
+        setup_style()
+        plot_weather(df, city)
+        print("Визуализация сохранена в weather_visualization.png!")
+
+    except Exception as e:
+        print("Ошибка:", e)
+
+
+if __name__ == "__main__":
+    main()